@@ -1,11 +1,42 @@
 # database.py
 import mysql.connector
 from mysql.connector import pooling
+import copy
 import os
-import json
 import statistics
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from dotenv import load_dotenv
 
+# orjson is much faster for the per-row JSON columns; fall back to stdlib if missing.
+try:
+    import orjson
+    # MySQL rejects binary strings for JSON columns, so hand the connector a str.
+    # NumPy arrays (e.g. path points from a tracker) serialize natively, with no .tolist() first.
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    _loads = orjson.loads
+except ImportError:
+    import json
+    def _dumps(obj):
+        return json.dumps(obj, default=lambda o: o.tolist()) # Same NumPy support as the orjson path
+    _loads = json.loads
+
+# FSR readings are 12-bit ADC values, stored as packed little-endian uint16 rather than JSON text
+FSR_DTYPE = np.dtype('<u2')
+
+def _pack_fsr(readings):
+    return np.rint(np.asarray(readings, dtype=np.float64)).astype(FSR_DTYPE).tobytes()
+
+def _unpack_fsr(blob):
+    readings = np.frombuffer(blob or b"", dtype=FSR_DTYPE) # Zero-copy view over the column bytes
+    readings.flags.writeable = False # The connector may hand back a bytearray, which cached rows share
+    return readings
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -14,7 +45,8 @@ connection_pool = None # Initialize to None
 try:
     connection_pool = pooling.MySQLConnectionPool(
         pool_name="neurogrip_pool",
-        pool_size=5,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")), # The connector caps this at 32
+        pool_reset_session=True,
         host=os.getenv("DB_HOST"),
         user=os.getenv("DB_USER"),
         password=os.getenv("DB_PASSWORD"),
@@ -26,183 +58,399 @@ except Exception as e:
     print("Please check your MySQL server is running and your .env file is correct.")
     exit() # Fails fast if the database can't be reached on startup
 
+# Worker threads for running independent queries on separate pooled connections
+query_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="neurogrip_db")
+# Worker threads for per-level grip stats; NumPy releases the GIL inside its reductions
+stats_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="neurogrip_stats")
+PARALLEL_COV_MIN_LEVELS = 32 # Below this, thread hand-off costs more than it saves
+
+def _get_connection():
+    """Checks a connection out of the pool, retrying once if the server can't be reached."""
+    try:
+        return connection_pool.get_connection()
+    except (mysql.connector.OperationalError, mysql.connector.InterfaceError) as e:
+        # The pool already pings each connection on checkout and reconnects a dropped one itself. This only
+        # fires when that reconnect fails (e.g. the server is restarting), and gives it one more attempt.
+        print(f"Could not reach the database, retrying: {e}")
+        return connection_pool.get_connection()
+
+@contextmanager
+def _db(dict_cursor=False):
+    """Checks a connection out of the pool and yields (conn, cursor), always returning it."""
+    conn = _get_connection()
+    # Unbuffered, so callers can iterate the cursor and stream large JSON rows one at a time
+    cursor = conn.cursor(dictionary=dict_cursor, buffered=False)
+    try:
+        yield conn, cursor
+    finally:
+        # No is_connected() ping first: the pool already pings and reconnects stale connections on checkout.
+        # Swallow close errors so they never mask the exception raised inside the block.
+        try:
+            cursor.close()
+        except Exception:
+            pass
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+# --- Report Caching ---
+class ResultCache:
+    """A small thread-safe LRU cache whose entries expire after `ttl` seconds."""
+    def __init__(self, maxsize=512, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+# Reports are re-requested on every screen refresh; writes below invalidate them
+session_results_cache = ResultCache()
+player_history_cache = ResultCache()
+# session_id -> player_id, so a new result can invalidate the right history. Bounded like the caches:
+# the oldest sessions are forgotten first, and a result for one of those just clears every cached history.
+_session_players = OrderedDict()
+_session_players_lock = threading.Lock()
+SESSION_PLAYERS_MAXSIZE = 512
+
+def _remember_session_player(session_id, player_id):
+    with _session_players_lock:
+        _session_players[session_id] = player_id
+        if len(_session_players) > SESSION_PLAYERS_MAXSIZE:
+            _session_players.popitem(last=False)
+
+def _invalidate_session(session_id):
+    session_results_cache.pop(session_id)
+    with _session_players_lock:
+        player_id = _session_players.get(session_id)
+    if player_id is None:
+        player_history_cache.clear() # Session created elsewhere; we can't tell whose history changed
+    else:
+        player_history_cache.pop(player_id)
+
+def _column_data_type(cursor, table, column):
+    """Lower-case DATA_TYPE of table.column in the current database, or "" if there is no such column."""
+    cursor.execute("""
+        SELECT DATA_TYPE FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    """, (table, column))
+    rows = cursor.fetchall()
+    data_type = rows[0][0] if rows else ""
+    if isinstance(data_type, (bytes, bytearray)): # Some connector versions return information_schema text as bytes
+        data_type = data_type.decode()
+    return data_type.lower()
+
 def init_db():
     """
     Initializes the database by creating tables if they don't already exist.
     This function should be run once using the db_setup.py script.
     """
-    conn = None
-    cursor = None
     try:
-        conn = connection_pool.get_connection()
-        cursor = conn.cursor()
-        print("Running initial database setup...")
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Players (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(100) NOT NULL,
-                gender VARCHAR(50),
-                age INT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE KEY unique_player (name, gender, age)
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS GameSessions (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                player_id INT NOT NULL,
-                session_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (player_id) REFERENCES Players(id) ON DELETE CASCADE
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS LevelResults (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                session_id INT NOT NULL,
-                level_name VARCHAR(50) NOT NULL,
-                duration_seconds FLOAT,
-                collision_count INT,
-                max_fsr INT,
-                min_fsr_move INT,
-                fsr_readings_move JSON,
-                path_points JSON,
-                shortest_path_length FLOAT,
-                FOREIGN KEY (session_id) REFERENCES GameSessions(id) ON DELETE CASCADE
-            )
-        """)
-        conn.commit()
+        with _db() as (conn, cursor):
+            print("Running initial database setup...")
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS Players (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    name VARCHAR(100) NOT NULL,
+                    name_lc VARCHAR(100) GENERATED ALWAYS AS (LOWER(name)) STORED,
+                    gender VARCHAR(50),
+                    age INT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE KEY unique_player (name_lc, gender, age)
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS GameSessions (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    player_id INT NOT NULL,
+                    session_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    INDEX idx_player (player_id),
+                    FOREIGN KEY (player_id) REFERENCES Players(id) ON DELETE CASCADE
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS LevelResults (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    session_id INT NOT NULL,
+                    level_name VARCHAR(50) NOT NULL,
+                    duration_seconds FLOAT,
+                    collision_count INT,
+                    max_fsr INT,
+                    min_fsr_move INT,
+                    fsr_readings_move MEDIUMBLOB,
+                    path_points JSON,
+                    shortest_path_length FLOAT,
+                    INDEX idx_session (session_id),
+                    FOREIGN KEY (session_id) REFERENCES GameSessions(id) ON DELETE CASCADE
+                )
+            """)
+
+            # Tables created before name_lc existed keep the old (name, gender, age) key; upgrade them in place
+            cursor.execute("""
+                SELECT COUNT(*) FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'Players' AND COLUMN_NAME = 'name_lc'
+            """)
+            if cursor.fetchall()[0][0] == 0:
+                print("Adding case-insensitive player name index...")
+                cursor.execute("""
+                    ALTER TABLE Players
+                    ADD COLUMN name_lc VARCHAR(100) GENERATED ALWAYS AS (LOWER(name)) STORED AFTER name,
+                    DROP INDEX unique_player,
+                    ADD UNIQUE KEY unique_player (name_lc, gender, age)
+                """)
+            conn.commit()
+
+            # Tables created before the packed format still hold JSON readings, which the binary reads and writes can't use
+            fsr_is_json = _column_data_type(cursor, 'LevelResults', 'fsr_readings_move') == "json"
+        if fsr_is_json:
+            migrate_fsr_readings_to_blob()
         print("Database tables are ready.")
     except Exception as e:
         print(f"Error during database initialization: {e}")
-    finally:
-        if conn and conn.is_connected():
-            if cursor:
-                cursor.close()
-            conn.close()
 
 # --- Player Management ---
+def _add_player(conn, cursor, name, gender, age):
+    # A returning player hits the unique key; LAST_INSERT_ID(id) makes lastrowid their existing ID
+    upsert_query = """
+        INSERT INTO Players (name, gender, age) VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)
+    """
+    cursor.execute(upsert_query, (name, gender, int(age)))
+    conn.commit()
+    return cursor.lastrowid
+
 def add_player(name, gender, age):
     """Adds a player if they don't exist, returns their ID."""
-    conn = None
-    cursor = None
     try:
-        conn = connection_pool.get_connection()
-        cursor = conn.cursor()
-        # Use LOWER() for case-insensitive lookup
-        query = "SELECT id FROM Players WHERE LOWER(name) = LOWER(%s) AND gender = %s AND age = %s"
-        cursor.execute(query, (name, gender, age))
-        result = cursor.fetchone()
-        
-        if result:
-            return result[0]
-        else:
-            insert_query = "INSERT INTO Players (name, gender, age) VALUES (%s, %s, %s)"
-            cursor.execute(insert_query, (name, gender, int(age)))
-            conn.commit()
-            return cursor.lastrowid
+        with _db() as (conn, cursor):
+            return _add_player(conn, cursor, name, gender, age)
     except Exception as e:
         print(f"Error in add_player: {e}")
         return None
-    finally:
-        if conn and conn.is_connected():
-            if cursor:
-                cursor.close()
-            conn.close()
 
 # --- Game Session Management ---
+def _create_game_session(conn, cursor, player_id):
+    cursor.execute("INSERT INTO GameSessions (player_id) VALUES (%s)", (player_id,))
+    conn.commit()
+    session_id = cursor.lastrowid
+    _remember_session_player(session_id, player_id)
+    print(f"Started new game session with ID: {session_id}")
+    return session_id
+
 def create_game_session(player_id):
     """Creates a new game session and returns its ID."""
-    conn = None
-    cursor = None
     try:
-        conn = connection_pool.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO GameSessions (player_id) VALUES (%s)", (player_id,))
-        conn.commit()
-        session_id = cursor.lastrowid
-        print(f"Started new game session with ID: {session_id}")
-        return session_id
+        with _db() as (conn, cursor):
+            return _create_game_session(conn, cursor, player_id)
     except Exception as e:
         print(f"Error in create_game_session: {e}")
         return None
-    finally:
-        if conn and conn.is_connected():
-            if cursor:
-                cursor.close()
-            conn.close()
+
+def add_player_and_create_session(name, gender, age):
+    """Finds or adds a player and opens a session for them on one pooled connection.
+    Returns (player_id, session_id), or (None, None) on error."""
+    try:
+        with _db() as (conn, cursor):
+            player_id = _add_player(conn, cursor, name, gender, age)
+            return player_id, _create_game_session(conn, cursor, player_id)
+    except Exception as e:
+        print(f"Error in add_player_and_create_session: {e}")
+        return None, None
 
 # --- Results Management ---
+# Deliberately not a server-side prepared statement: cursors live for a single pool checkout, so
+# PREPARE/EXECUTE/CLOSE would add round trips, and executemany() already sends one multi-row INSERT.
+LEVEL_RESULT_INSERT_SQL = """
+    INSERT INTO LevelResults (
+        session_id, level_name, duration_seconds, collision_count,
+        max_fsr, min_fsr_move, fsr_readings_move, path_points, shortest_path_length
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+def _level_result_values(session_id, metrics):
+    """Builds the LevelResults insert parameters for one level's metrics."""
+    fsr_blob = _pack_fsr(metrics.get("FSR_Readings_Move", []))
+    path_json = _dumps(metrics.get("Path_Points", []))
+    return (
+        session_id, metrics.get("LevelName"), metrics.get("Duration"),
+        metrics.get("Collision_Count"), metrics.get("Max_FSR"), metrics.get("Min_FSR_Move"),
+        fsr_blob, path_json, metrics.get("Shortest_Path_Length")
+    )
+
 def save_level_result(session_id, metrics):
     """Saves the metrics from a completed level."""
-    conn = None
-    cursor = None
     try:
-        conn = connection_pool.get_connection()
-        cursor = conn.cursor()
-        sql = """
-            INSERT INTO LevelResults (
-                session_id, level_name, duration_seconds, collision_count,
-                max_fsr, min_fsr_move, fsr_readings_move, path_points, shortest_path_length
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        fsr_json = json.dumps(metrics.get("FSR_Readings_Move", []))
-        path_json = json.dumps(metrics.get("Path_Points", []))
-        values = (
-            session_id, metrics.get("LevelName"), metrics.get("Duration"),
-            metrics.get("Collision_Count"), metrics.get("Max_FSR"), metrics.get("Min_FSR_Move"),
-            fsr_json, path_json, metrics.get("Shortest_Path_Length")
-        )
-        cursor.execute(sql, values)
-        conn.commit()
+        with _db() as (conn, cursor):
+            cursor.execute(LEVEL_RESULT_INSERT_SQL, _level_result_values(session_id, metrics))
+            conn.commit()
+        _invalidate_session(session_id)
     except Exception as e:
         print(f"Error in save_level_result: {e}")
-    finally:
-        if conn and conn.is_connected():
-            if cursor:
-                cursor.close()
-            conn.close()
+
+def save_level_results_batch(session_id, metrics_list):
+    """Saves several completed levels in one multi-row INSERT and a single commit."""
+    if not metrics_list:
+        return
+    try:
+        with _db() as (conn, cursor):
+            # The connector rewrites executemany() INSERTs into a single multi-row statement
+            cursor.executemany(LEVEL_RESULT_INSERT_SQL, [_level_result_values(session_id, m) for m in metrics_list])
+            conn.commit()
+        _invalidate_session(session_id)
+    except Exception as e:
+        print(f"Error in save_level_results_batch: {e}")
+
+class LazyLevelResult:
+    """
+    One LevelResults row, readable with the same keys as the metrics dict passed to save_level_result.
+    The readings and path columns are only decoded the first time they are accessed.
+    """
+    __slots__ = ("_row", "_fsr", "_path")
+    _COLUMNS = {
+        "LevelName": "level_name",
+        "Duration": "duration_seconds",
+        "Collision_Count": "collision_count",
+        "Max_FSR": "max_fsr",
+        "Min_FSR_Move": "min_fsr_move",
+        "Shortest_Path_Length": "shortest_path_length"
+    }
+
+    def __init__(self, row):
+        self._row = row
+        self._fsr = None
+        self._path = None
+
+    @property
+    def FSR_Readings_Move(self):
+        if self._fsr is None:
+            self._fsr = _unpack_fsr(self._row['fsr_readings_move']) # uint16 array; grip_cov() reduces it without boxing
+        return self._fsr
+
+    @property
+    def Path_Points(self):
+        if self._path is None:
+            self._path = _loads(self._row['path_points'])
+        return self._path
+
+    def __getitem__(self, key):
+        if key == "FSR_Readings_Move": return self.FSR_Readings_Move
+        if key == "Path_Points": return self.Path_Points
+        return self._row[self._COLUMNS[key]]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
 def get_session_results(session_id):
     """Retrieves all results for a session ID to generate a report."""
-    conn = None
-    cursor = None
-    results = []
+    # The cache holds the raw rows, which are never handed out: each caller gets its own list and its own
+    # lazily decoded results, so nothing a caller mutates can reach the cache (the readings arrays are read-only)
+    rows = session_results_cache.get(session_id)
+    if rows is not None:
+        return [LazyLevelResult(row) for row in rows]
     try:
-        conn = connection_pool.get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM LevelResults WHERE session_id = %s ORDER BY id ASC", (session_id,))
-        rows = cursor.fetchall()
-        for row in rows:
-            results.append({
-                "LevelName": row['level_name'],
-                "Duration": row['duration_seconds'],
-                "Collision_Count": row['collision_count'],
-                "Max_FSR": row['max_fsr'],
-                "Min_FSR_Move": row['min_fsr_move'],
-                "FSR_Readings_Move": json.loads(row['fsr_readings_move']),
-                "Path_Points": json.loads(row['path_points']),
-                "Shortest_Path_Length": row['shortest_path_length']
-            })
-        return results
+        with _db(dict_cursor=True) as (conn, cursor):
+            cursor.execute("""
+                SELECT level_name, duration_seconds, collision_count, max_fsr, min_fsr_move,
+                       fsr_readings_move, path_points, shortest_path_length
+                FROM LevelResults WHERE session_id = %s ORDER BY id ASC
+            """, (session_id,))
+            # Unbuffered cursor: rows stream in, and their JSON is only decoded if a caller reads it
+            rows = list(cursor)
+        session_results_cache.set(session_id, rows)
+        return [LazyLevelResult(row) for row in rows]
     except Exception as e:
         print(f"Error fetching session results: {e}")
         return []
-    finally:
-        if conn and conn.is_connected():
-            if cursor:
-                cursor.close()
-            conn.close()
+
+def get_session_paths_as_arrays(session_id):
+    """
+    Returns [(level_name, points), ...] for a session, where points is an (N, 2) float32 array.
+    For callers that do vector maths on the paths and would otherwise convert the lists themselves.
+    """
+    try:
+        with _db(dict_cursor=True) as (conn, cursor):
+            cursor.execute(
+                "SELECT level_name, path_points FROM LevelResults WHERE session_id = %s ORDER BY id ASC",
+                (session_id,)
+            )
+            return [(row['level_name'], np.asarray(_loads(row['path_points']), dtype=np.float32).reshape(-1, 2))
+                    for row in cursor]
+    except Exception as e:
+        print(f"Error fetching session paths: {e}")
+        return []
 
 # --- NEW: Historical Data Function ---
+def _level_cov(fsr_blob):
+    """Grip CoV (%) for one level's packed readings, or None if there are too few to measure."""
+    fsr_readings = _unpack_fsr(fsr_blob)
+    if fsr_readings.size < 2:
+        return None
+    mean_fsr = float(fsr_readings.mean())
+    stdev_fsr = float(fsr_readings.std(ddof=1))
+    return (stdev_fsr / mean_fsr) * 100 if mean_fsr > 0 else 0
+
+def _fetch_level_covs(cursor, player_id):
+    """Returns the grip CoV (%) of every level the player has completed."""
+    cursor.execute("""
+        SELECT r.fsr_readings_move
+        FROM LevelResults r
+        JOIN GameSessions s ON r.session_id = s.id
+        WHERE s.player_id = %s
+    """, (player_id,))
+    # Packed readings are two bytes a sample, so holding every level's blob at once is cheap
+    fsr_blobs = [row['fsr_readings_move'] for row in cursor]
+    if len(fsr_blobs) < PARALLEL_COV_MIN_LEVELS:
+        level_covs = map(_level_cov, fsr_blobs)
+    else:
+        level_covs = stats_executor.map(_level_cov, fsr_blobs)
+    return [cov for cov in level_covs if cov is not None]
+
+def _fetch_level_covs_pooled(player_id):
+    """Runs _fetch_level_covs on its own pooled connection so it can overlap other queries."""
+    with _db(dict_cursor=True) as (conn, cursor):
+        return _fetch_level_covs(cursor, player_id)
+
 def get_player_history(player_id):
     """
     Retrieves and calculates a historical summary of a player's performance.
     """
-    conn = None
-    cursor = None
+    cached = player_history_cache.get(player_id)
+    if cached is not None:
+        return copy.deepcopy(cached) # Callers get their own summary; the cached one is never handed out
+
     summary = {
         "total_sessions": 0,
         "total_levels_played": 0,
@@ -213,66 +461,81 @@ def get_player_history(player_id):
     }
 
     try:
-        conn = connection_pool.get_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        # SQL query to get all level results for a player by joining the tables
-        sql = """
-            SELECT 
-                r.level_name,
-                r.duration_seconds,
-                r.collision_count,
-                r.fsr_readings_move,
-                s.id as session_id
-            FROM LevelResults r
-            JOIN GameSessions s ON r.session_id = s.id
-            WHERE s.player_id = %s
-        """
-        cursor.execute(sql, (player_id,))
-        results = cursor.fetchall()
-
-        if not results:
-            return summary # Return the empty summary if no records are found
-
-        # --- Process the results in Python ---
-        total_collisions = 0
-        all_level_covs = []
-        unique_sessions = set()
-        levels_by_difficulty = {}
-
-        for row in results:
-            unique_sessions.add(row['session_id'])
-            summary["total_playtime_seconds"] += row['duration_seconds']
-            total_collisions += row['collision_count']
-            
+        # The CoV query is the slowest one, so start it while the totals are fetched
+        covs_future = query_executor.submit(_fetch_level_covs_pooled, player_id)
+
+        with _db(dict_cursor=True) as (conn, cursor):
+            # Let MySQL do the totals so only a single row comes back over the wire
+            cursor.execute("""
+                SELECT
+                    COUNT(*) AS total_levels,
+                    COUNT(DISTINCT s.id) AS total_sessions,
+                    SUM(r.duration_seconds) AS total_time,
+                    SUM(r.collision_count) AS total_collisions
+                FROM LevelResults r
+                JOIN GameSessions s ON r.session_id = s.id
+                WHERE s.player_id = %s
+            """, (player_id,))
+            totals = cursor.fetchall()[0] # fetchall() drains the unbuffered result for the next query
+
+            if not totals['total_levels']:
+                player_history_cache.set(player_id, copy.deepcopy(summary))
+                return summary # Return the empty summary if no records are found
+
+            summary["total_sessions"] = totals['total_sessions']
+            summary["total_levels_played"] = totals['total_levels']
+            summary["total_playtime_seconds"] = float(totals['total_time'] or 0)
+            summary["avg_collisions_per_level"] = int(totals['total_collisions'] or 0) / totals['total_levels']
+
             # Count levels played by difficulty
-            level_name = row['level_name']
-            levels_by_difficulty[level_name] = levels_by_difficulty.get(level_name, 0) + 1
-
-            # Calculate CoV for this level's grip data
-            fsr_readings = json.loads(row['fsr_readings_move'])
-            if len(fsr_readings) > 1:
-                mean_fsr = statistics.mean(fsr_readings)
-                stdev_fsr = statistics.stdev(fsr_readings)
-                cov = (stdev_fsr / mean_fsr) * 100 if mean_fsr > 0 else 0
-                all_level_covs.append(cov)
-        
-        # --- Final calculations ---
-        summary["total_sessions"] = len(unique_sessions)
-        summary["total_levels_played"] = len(results)
-        summary["levels_by_difficulty"] = levels_by_difficulty
-        if summary["total_levels_played"] > 0:
-            summary["avg_collisions_per_level"] = total_collisions / summary["total_levels_played"]
+            cursor.execute("""
+                SELECT r.level_name, COUNT(*) AS level_count
+                FROM LevelResults r
+                JOIN GameSessions s ON r.session_id = s.id
+                WHERE s.player_id = %s
+                GROUP BY r.level_name
+            """, (player_id,))
+            summary["levels_by_difficulty"] = {row['level_name']: row['level_count'] for row in cursor.fetchall()}
+
+        all_level_covs = covs_future.result()
         if all_level_covs:
             summary["avg_grip_cov"] = statistics.mean(all_level_covs)
-            
+
+        player_history_cache.set(player_id, copy.deepcopy(summary))
         return summary
 
     except Exception as e:
         print(f"Error in get_player_history: {e}")
         return None # Return None on error
-    finally:
-        if conn and conn.is_connected():
-            if cursor:
-                cursor.close()
-            conn.close()
\ No newline at end of file
+
+# --- Migrations ---
+def migrate_fsr_readings_to_blob():
+    """
+    Rewrites LevelResults.fsr_readings_move from the old JSON column to packed uint16 readings.
+    Safe to run more than once; it does nothing if the column is already a MEDIUMBLOB, and it picks up
+    where it left off if an earlier run died after adding the temporary column.
+    """
+    try:
+        with _db() as (conn, cursor):
+            if _column_data_type(cursor, 'LevelResults', 'fsr_readings_move') != "json":
+                print("fsr_readings_move is already stored as binary; nothing to migrate.")
+                return
+
+            print("Converting FSR readings from JSON to binary...")
+            if not _column_data_type(cursor, 'LevelResults', 'fsr_readings_blob'):
+                cursor.execute("ALTER TABLE LevelResults ADD COLUMN fsr_readings_blob MEDIUMBLOB AFTER min_fsr_move")
+            cursor.execute("SELECT id, fsr_readings_move FROM LevelResults")
+            rows = cursor.fetchall()
+            cursor.executemany(
+                "UPDATE LevelResults SET fsr_readings_blob = %s WHERE id = %s",
+                [(_pack_fsr(_loads(readings) if readings else []), row_id) for row_id, readings in rows]
+            )
+            conn.commit()
+            cursor.execute("""
+                ALTER TABLE LevelResults
+                DROP COLUMN fsr_readings_move,
+                RENAME COLUMN fsr_readings_blob TO fsr_readings_move
+            """)
+            print(f"Converted {len(rows)} level results.")
+    except Exception as e:
+        print(f"Error during FSR readings migration: {e}")
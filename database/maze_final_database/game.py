@@ -5,19 +5,92 @@ import serial
 import time
 import os
 import random
-import statistics
+import math
+import bisect
+import io
 import subprocess
+import tempfile
+import threading
 from collections import deque
-from pyvidplayer2 import Video
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from settings import *
-from sprites import Ball, Hole, Barrier, Button, Particle
-from fpdf import FPDF
-import matplotlib.pyplot as plt
+from sprites import Ball, Hole, Button, ParticleSystem, build_wall_layer
 import database
 
-# Helper function
+# Per-frame scale factors, folded once so the hot paths multiply instead of divide
+TILT_TO_SPEED = PLAYER_SPEED / TILT_SENSITIVITY
+FSR_TO_METER_WIDTH = GRIP_METER_SIZE[0] / MAX_FSR_VALUE
+
+# Qualitative report sentences, one per score band; bisect on the band edges picks the sentence
+GRIP_SUMMARY_BOUNDS = (15, 25) # Average grip CoV (%): below 15, below 25, otherwise
+GRIP_SUMMARIES = (
+    "Grip control was steady and consistent, indicating excellent force modulation.",
+    "Grip control was generally stable with some minor fluctuations.",
+    "Grip control showed significant fluctuation, suggesting an opportunity to improve steadiness.",
+)
+COLLISION_SUMMARY_BOUNDS = (5, 15) # Average collisions per level: below 5, below 15, otherwise
+COLLISION_SUMMARIES = (
+    "Navigational accuracy was very high with minimal collisions.",
+    "Navigation was effective with a moderate number of collisions.",
+    "A high number of collisions suggests a focus on improving fine motor precision could be beneficial.",
+)
+
+# Helper functions
 def clamp(v, lo, hi):
-    return max(lo, min(hi, v))
+    # Conditional expressions rather than max(lo, min(hi, v)): no builtin calls on the per-frame HUD path
+    return lo if v < lo else hi if v > hi else v
+
+def hits_wall(rect, wall_mask):
+    """True if rect overlaps a wall tile. Only the handful of tiles under the rect are looked up, however big the maze."""
+    first_col, last_col = rect.left // TILE_SIZE, (rect.right - 1) // TILE_SIZE
+    first_row, last_row = rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE
+    # Clamp the start so a rect partly off-screen can't wrap round to the far edge; tiles outside the maze are empty
+    return bool(wall_mask[max(first_row, 0):last_row + 1, max(first_col, 0):last_col + 1].any())
+
+def grip_covs(fsr_readings_per_level):
+    """
+    Grip CoV (%) of every level's FSR readings (0 where there are too few to measure).
+    All levels are concatenated and reduced per segment, so each statistic is a single NumPy pass.
+    """
+    levels = [np.asarray(readings, dtype=np.float64).ravel() for readings in fsr_readings_per_level]
+    counts = np.array([level.size for level in levels], dtype=np.int64)
+    covs = np.zeros(len(levels))
+    measurable = counts > 1
+    if not measurable.any(): return covs.tolist()
+    n = counts[measurable]
+    readings = np.concatenate([level for level, ok in zip(levels, measurable) if ok])
+    starts = np.concatenate(([0], np.cumsum(n)[:-1]))
+    means = np.add.reduceat(readings, starts) / n
+    deviations = readings - np.repeat(means, n) # Deviations from each level's own mean, as std(ddof=1) uses
+    stdevs = np.sqrt(np.add.reduceat(deviations * deviations, starts) / (n - 1))
+    covs[measurable] = np.divide(stdevs, means, out=np.zeros_like(means), where=means > 0) * 100
+    return covs.tolist()
+
+def path_length(path_points):
+    """Total length of a level's path, summed over every segment between consecutive points."""
+    points = np.asarray(path_points, dtype=np.float64).reshape(-1, 2)
+    steps = np.diff(points, axis=0)
+    return float(np.hypot(steps[:, 0], steps[:, 1]).sum())
+
+def pdf_table(pdf, widths, header, rows, aligns=None):
+    """Writes a bordered report table: a bold header row, then each row of pre-formatted cell strings (centred unless aligns says otherwise)."""
+    aligns = aligns or ['C'] * len(widths)
+    last = len(widths) - 1
+    pdf.set_font("Arial", 'B', 10)
+    for i, (width, text) in enumerate(zip(widths, header)): pdf.cell(width, 8, text, 1, int(i == last), 'C')
+    pdf.set_font("Arial", size=10)
+    for row in rows:
+        for i, (width, text, align) in enumerate(zip(widths, row, aligns)): pdf.cell(width, 8, text, 1, int(i == last), align)
+
+def pdf_image(pdf, png, **placement):
+    """Places an in-memory PNG in the report. fpdf2 reads it directly; the legacy fpdf package only takes a path, so there it goes through a temporary file."""
+    from fpdf import FPDF_VERSION
+    if not FPDF_VERSION.startswith("1."):
+        pdf.image(png, **placement); return
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f: f.write(png.getvalue())
+    try: pdf.image(f.name, **placement) # Read and embedded right away, so the file can go straight after
+    finally: os.remove(f.name)
 
 class Game:
     def __init__(self):
@@ -26,6 +99,16 @@ class Game:
         self.clock = pygame.time.Clock()
         self.running = True
         self.game_state = "user_info_entry"
+        # game_state -> method that runs that screen until the state changes, see run()
+        self._state_handlers = {
+            "user_info_entry": self._get_user_info,
+            "main_menu": self._show_main_menu,
+            "show_history": self._show_history_screen,
+            "settings": self._show_settings_menu,
+            "playing": self._play_current_level,
+            "ask_continue": self._ask_to_continue,
+            "generate_report": self._finish_session
+        }
 
         # User and Session data
         self.player_id = None
@@ -38,16 +121,40 @@ class Game:
         self.completed_levels_metrics = []
         self.current_level_metrics = {}
         self.player_history_data = None
+        # Finished levels are written on one background thread (so they stay in order) to keep MySQL off the game loop
+        self._level_saver = ThreadPoolExecutor(max_workers=1, thread_name_prefix="neurogrip_save")
+        self._pending_saves = []
         
         # Hardware Data
         self.current_fsr = 0
         self.accel_data = [0, 0, 0]
         self.gyro_data = [0, 0, 0]
+        self._latest_sample = None # Newest (fsr, ax, ay, az, gx, gy, gz) from the sensor thread, not yet consumed
+        self._sample_lock = threading.Lock()
+        self._sensor_stop = threading.Event()
+        self._sensor_thread = None
+        self._video_frame = None # Newest decoded background video frame not yet composited, see _video_decode_loop()
+        self._video_lock = threading.Lock()
         self.fsr_threshold = FSR_THRESHOLD
         
         # Settings
         self.music_enabled = True
-        self.hud_font = pygame.font.Font(None, HUD_FONT_SIZE)
+        # Every font size the game uses, loaded once instead of on each menu entry
+        self.fonts = {size: pygame.font.Font(None, size) for size in (40, 42, 50, 74, HUD_FONT_SIZE)}
+        self.hud_font = self.fonts[HUD_FONT_SIZE]
+        self.title_font = self.fonts[74]
+        self._text_cache = {} # (font, text, color) -> rendered Surface, see _render()
+        self._menu_bg_cache = None # Static menu screen without its buttons, see _cache_menu_background()
+        self._menus = {} # menu name -> its Button list, see _menu_buttons()
+        self._level_cache = {} # level name -> (player start, Hole, static wall+hole layer, shortest path), see _build_level()
+        self._chart_fig, self._chart_axes = None, None # Report chart, created on first use, see _create_performance_chart()
+        # The report (database reads, chart, PDF, file write) is built off the main thread so the window stays responsive
+        self._report_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="neurogrip_report")
+        self._grip_meter_empty, self._grip_meter_full = self._build_grip_meter()
+        self._timer_secs, self._timer_surf = -1, None # Whole seconds currently shown by the HUD timer
+        self.particles = ParticleSystem() # One set of particle slots, reused by every level
+        ParticleSystem.preload(YELLOW, range(2, 6)) # Movement trail
+        ParticleSystem.preload(RED, range(3, 8)) # Collision burst
         
         self.menu_background = None
         try:
@@ -57,78 +164,173 @@ class Game:
             print(f"Warning: Could not load menu background image. {e}")
 
         try:
-            self.ser = serial.Serial(SERIAL_PORT, 115200, timeout=0.02)
+            self.ser = serial.Serial(SERIAL_PORT, SERIAL_BAUD, timeout=SERIAL_READ_TIMEOUT)
             print(f"Successfully connected to NeuroGrip Ball on {SERIAL_PORT}")
             self.ser.flushInput()
         except serial.SerialException:
             print(f"Error: Could not connect to NeuroGrip Ball on {SERIAL_PORT}.")
             print("[INFO] Running in Keyboard Simulation Mode.")
             self.ser = None
+        if self.ser:
+            # Serial reads happen off the render thread, so USB scheduling never stalls a frame
+            self._sensor_thread = threading.Thread(target=self._sensor_loop, name="sensor-reader", daemon=True)
+            self._sensor_thread.start()
+
+    def _sensor_loop(self):
+        """Runs on the sensor thread: reads the ball's serial stream and publishes only its newest complete frame."""
+        serial_buffer = b"" # Trailing partial line carried over between reads
+        while not self._sensor_stop.is_set():
+            try:
+                # Waits at most SERIAL_READ_TIMEOUT for data, then takes everything that has arrived
+                serial_buffer += self.ser.read(self.ser.in_waiting or 1)
+            except (serial.SerialException, OSError) as e:
+                print(f"Error reading hardware data: {e}")
+                self._sensor_stop.wait(1.0) # Don't spin on a port that keeps failing
+                continue
+            *lines, serial_buffer = serial_buffer.split(b'\n')
+            for line in reversed(lines): # Only the newest complete frame matters
+                data = line.split(b',')
+                if len(data) != 7: continue
+                try:
+                    sample = tuple(map(int, data)) # int() takes bytes and ignores the trailing \r
+                except ValueError:
+                    continue # Garbled line (noise, or a partial first line after opening): try the next older one
+                with self._sample_lock: self._latest_sample = sample
+                break
 
     def _read_hardware_data(self):
+        """Takes the sensor thread's newest frame, if one arrived since the last call. Never blocks on the port."""
         if not self.ser: return False
-        try:
-            if self.ser.in_waiting > 0:
-                line = self.ser.readline().decode('utf-8').strip()
-                data = line.split(',')
-                if len(data) == 7:
-                    self.current_fsr = int(data[0])
-                    self.accel_data = [int(data[1]), int(data[2]), int(data[3])]
-                    self.gyro_data = [int(data[4]), int(data[5]), int(data[6])]
-                    return True
-        except Exception as e:
-            print(f"Error reading hardware data: {e}")
-        return False
+        with self._sample_lock:
+            sample, self._latest_sample = self._latest_sample, None
+        if sample is None: return False
+        fsr, ax, ay, az, gx, gy, gz = sample
+        self.current_fsr = fsr
+        self.accel_data = [ax, ay, az]
+        self.gyro_data = [gx, gy, gz]
+        return True
 
     def run(self):
         while self.running:
-            if self.game_state == "user_info_entry": self._get_user_info()
-            elif self.game_state == "main_menu": self._show_main_menu()
-            elif self.game_state == "show_history": self._show_history_screen()
-            elif self.game_state == "settings": self._show_settings_menu()
-            elif self.game_state == "playing":
-                level_name = self.level_sequence[self.current_level_index]
-                self._play_level(level_name)
-            elif self.game_state == "ask_continue": self._ask_to_continue()
-            elif self.game_state == "generate_report":
-                self._generate_report()
-                self.current_level_index = 0
-                self.game_state = "main_menu"
-
-        if self.ser: self.ser.close()
+            handler = self._state_handlers.get(self.game_state)
+            if handler is None: print(f"Error: Unknown game state '{self.game_state}'"); break
+            handler()
+
+        self._level_saver.shutdown(wait=True) # Don't lose a level that finished just before quitting
+        self._report_worker.shutdown(wait=True)
+        if self.ser:
+            self._sensor_stop.set(); self._sensor_thread.join() # The thread may be inside ser.read()
+            self.ser.close()
         pygame.quit()
         sys.exit()
 
+    def _play_current_level(self):
+        self._play_level(self.level_sequence[self.current_level_index])
+
+    def _finish_session(self):
+        """Runs _generate_report on the report worker, showing a progress screen until it is done."""
+        pygame.display.set_caption("Generating Report")
+        report = self._report_worker.submit(self._generate_report)
+        while not report.done():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT: self.running = False # Leave once the report is written
+            self._draw_menu_background("Generating Report" + "." * (pygame.time.get_ticks() // 400 % 4))
+            pygame.display.flip()
+            self.clock.tick(30) # Just enough to animate the dots
+        # A failed report is logged rather than re-raised, so it can't tear down run() and the session still ends normally
+        error = report.exception()
+        if error is not None: print(f"Error generating report: {error!r}")
+        self.current_level_index = 0
+        self.game_state = "main_menu"
+
     def _handle_menu_events(self, buttons):
-        for event in pygame.event.get():
+        # Nothing animates on a menu, so sleep until input arrives instead of polling at 60 FPS
+        event = pygame.event.wait(MENU_IDLE_TIMEOUT_MS)
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT: events.insert(0, event)
+        # Only quit, exposure, motion and clicks matter here; every other event type is dropped after one comparison
+        for event in events:
             if event.type == pygame.QUIT: return "quit"
-            for button in buttons:
-                if button.is_clicked(event): return button.text
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            elif event.type == pygame.WINDOWEXPOSED: self._repaint_menu(buttons) # Covered or restored: nothing on screen can be trusted
+            elif event.type == pygame.MOUSEMOTION:
+                for button in buttons: button.check_hover(event.pos) # Hover must be current before a click in the same batch
+            elif event.type == pygame.MOUSEBUTTONDOWN:
                 for button in buttons:
                     if button.is_hovered: button.is_pressed = True
-            if event.type == pygame.MOUSEBUTTONUP:
+            elif event.type == pygame.MOUSEBUTTONUP:
+                clicked = next((button for button in buttons if button.is_pressed and button.is_hovered), None)
                 for button in buttons: button.is_pressed = False
+                if clicked: return clicked.text
         return None
 
+    def _render(self, font, text, color):
+        """Returns font.render(text, True, color), rasterizing each distinct string only once."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE: self._text_cache.clear() # Typed input keeps adding new strings
+            surf = font.render(text, True, color).convert_alpha() # Display pixel format, so every later blit takes the fast path
+            self._text_cache[key] = surf
+        return surf
+
+    def _menu_buttons(self, menu_name, build_buttons):
+        """Returns a menu's buttons, constructing them (and their pre-rendered surfaces) only on the first visit."""
+        buttons = self._menus.get(menu_name)
+        if buttons is None: buttons = self._menus[menu_name] = build_buttons()
+        for button in buttons: button.is_pressed = False # A press never carries over from the last visit
+        return buttons
+
     def _draw_menu_background(self, title):
         if self.menu_background: self.screen.blit(self.menu_background, (0, 0))
         else: self.screen.fill(BLUE)
         if title.strip():
-            title_text = pygame.font.Font(None, 74).render(title, True, WHITE)
+            title_text = self._render(self.title_font, title, WHITE)
             self.screen.blit(title_text, title_text.get_rect(center=(SCREEN_WIDTH / 2, 100)))
 
+    def _cache_menu_background(self):
+        """Snapshots the fully drawn static part of a menu and presents it once."""
+        self._menu_bg_cache = self.screen.copy()
+        pygame.display.flip()
+
+    def _repaint_menu(self, buttons):
+        """Redraws the whole menu from the cached background and presents it with a full flip."""
+        self.screen.blit(self._menu_bg_cache, (0, 0))
+        for button in buttons: button.draw(self.screen)
+        pygame.display.flip()
+
+    def _update_menu_buttons(self, buttons, button_states):
+        """Redraws only the buttons whose hover/press/label state changed and pushes just their rects."""
+        dirty_rects = []
+        for i, button in enumerate(buttons):
+            state = (button.is_hovered, button.is_pressed, button.text)
+            if button_states[i] == state: continue
+            button_states[i] = state
+            area = button.rect.union(button.shadow_rect) # A pressed button is drawn at its shadow offset
+            self.screen.blit(self._menu_bg_cache, area, area)
+            button.draw(self.screen)
+            dirty_rects.append(area)
+        # A handful of small rects is far cheaper to present than a full-screen flip()
+        if dirty_rects: pygame.display.update(dirty_rects)
+
     def _get_user_info(self):
         pygame.display.set_caption("Enter User Information")
-        input_font = pygame.font.Font(None, 40)
+        input_font = self.fonts[40]
         input_boxes = {"name": pygame.Rect(SCREEN_WIDTH/2 - 150, 200, 300, 50), "gender": pygame.Rect(SCREEN_WIDTH/2 - 150, 300, 300, 50), "age": pygame.Rect(SCREEN_WIDTH/2 - 150, 400, 300, 50)}
         active_box, user_inputs = None, {"name": "", "gender": "", "age": ""}
-        start_button = Button(SCREEN_WIDTH/2 - 100, 550, 200, 60, "Start Game", input_font, WHITE, GREEN)
+        start_button = self._menu_buttons("user_info", lambda: [Button(SCREEN_WIDTH/2 - 100, 550, 200, 60, "Start Game", input_font, WHITE, GREEN)])[0]
         
-        input_running = True
+        input_running, needs_redraw = True, True # The first frame is always drawn
         while input_running:
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            if not events and not needs_redraw:
+                # Nothing here animates, so sleep until input arrives instead of redrawing the same frame flat out
+                event = pygame.event.wait(MENU_IDLE_TIMEOUT_MS)
+                if event.type == pygame.NOEVENT: continue
+                events = [event]
+            needs_redraw = False
+            for event in events:
                 if event.type == pygame.QUIT: input_running = False; self.running = False
+                if event.type == pygame.MOUSEMOTION: start_button.check_hover(event.pos) # Hover must be current before a click in the same batch
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     active_box = next((key for key, box in input_boxes.items() if box.collidepoint(event.pos)), None)
                 if event.type == pygame.KEYDOWN and active_box:
@@ -150,26 +352,30 @@ class Game:
             mouse_pos = pygame.mouse.get_pos()
             start_button.check_hover(mouse_pos)
             self._draw_menu_background("   ")
+            text_blits = []
             for key, box in input_boxes.items():
-                self.screen.blit(input_font.render(key.capitalize() + ":", True, WHITE), (box.x, box.y - 30))
                 pygame.draw.rect(self.screen, YELLOW if active_box == key else WHITE, box, 2)
-                self.screen.blit(input_font.render(user_inputs[key], True, WHITE), (box.x + 5, box.y + 5))
+                text_blits.append((self._render(input_font, key.capitalize() + ":", WHITE), (box.x, box.y - 30)))
+                text_blits.append((self._render(input_font, user_inputs[key], WHITE), (box.x + 5, box.y + 5)))
+            self.screen.blits(text_blits, doreturn=0)
             start_button.draw(self.screen)
             pygame.display.flip()
 
     def _show_main_menu(self):
         pygame.display.set_caption("Main Menu")
-        button_font = pygame.font.Font(None, 50)
-        buttons = [
+        button_font = self.fonts[50]
+        buttons = self._menu_buttons("main_menu", lambda: [
             Button(SCREEN_WIDTH/2 - 150, 220, 300, 70, "Start Game", button_font, WHITE, GREEN),
             Button(SCREEN_WIDTH/2 - 150, 310, 300, 70, "Player History", button_font, WHITE, BLUE),
             Button(SCREEN_WIDTH/2 - 150, 400, 300, 70, "Settings", button_font, WHITE, YELLOW),
             Button(SCREEN_WIDTH/2 - 150, 490, 300, 70, "Quit", button_font, WHITE, RED)
-        ]
+        ])
+        self._draw_menu_background("   ")
+        self._cache_menu_background()
+        button_states = [None] * len(buttons)
         
         menu_running = True
         while menu_running:
-            self.clock.tick(60)
             mouse_pos = pygame.mouse.get_pos()
             for button in buttons: button.check_hover(mouse_pos)
             action = self._handle_menu_events(buttons)
@@ -189,20 +395,50 @@ class Game:
 
             elif action == "Settings": self.game_state, menu_running = "settings", False
             elif action == "Quit": menu_running = False; self.running = False
-            self._draw_menu_background("   ")
-            for button in buttons: button.draw(self.screen)
-            pygame.display.flip()
+            self._update_menu_buttons(buttons, button_states)
 
     def _show_history_screen(self):
         pygame.display.set_caption("Player History")
-        info_font = pygame.font.Font(None, 42)
-        value_font = pygame.font.Font(None, 42)
-        back_button = Button(SCREEN_WIDTH/2 - 150, SCREEN_HEIGHT - 100, 300, 70, "Back", pygame.font.Font(None, 50), WHITE, GREEN)
-        buttons = [back_button]
+        info_font = self.fonts[42]
+        value_font = self.fonts[42]
+        buttons = self._menu_buttons("history", lambda: [Button(SCREEN_WIDTH/2 - 150, SCREEN_HEIGHT - 100, 300, 70, "Back", self.fonts[50], WHITE, GREEN)])
+        back_button = buttons[0]
+
+        # The history data cannot change while this screen is open, so it is drawn once
+        self._draw_menu_background(f"History for {self.user_name}")
+        
+        if self.player_history_data:
+            y_pos = 180
+            data = self.player_history_data
+            
+            def draw_line(label, value, y):
+                label_surf = self._render(info_font, label, WHITE)
+                value_surf = self._render(value_font, value, YELLOW)
+                self.screen.blit(label_surf, (150, y))
+                self.screen.blit(value_surf, (600, y))
+
+            draw_line("Total Sessions Played:", str(data['total_sessions']), y_pos)
+            draw_line("Total Levels Completed:", str(data['total_levels_played']), y_pos + 50)
+            
+            playtime_min = data['total_playtime_seconds'] / 60
+            draw_line("Total Playtime:", f"{playtime_min:.1f} minutes", y_pos + 100)
+            
+            draw_line("Avg Collisions / Level:", f"{data['avg_collisions_per_level']:.2f}", y_pos + 150)
+            draw_line("Avg Grip Stability (CoV%):", f"{data['avg_grip_cov']:.2f}%", y_pos + 200)
+
+            levels_played_text = ", ".join([f"{lvl}: {count}" for lvl, count in data['levels_by_difficulty'].items()])
+            if not levels_played_text: levels_played_text = "None"
+            draw_line("Levels Played Breakdown:", levels_played_text, y_pos + 250)
+
+        else:
+            no_data_surf = self._render(info_font, "No historical data found for this player.", RED)
+            self.screen.blit(no_data_surf, no_data_surf.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2)))
+
+        self._cache_menu_background()
+        button_states = [None] * len(buttons)
 
         history_running = True
         while history_running:
-            self.clock.tick(60)
             mouse_pos = pygame.mouse.get_pos()
             back_button.check_hover(mouse_pos)
             
@@ -210,47 +446,18 @@ class Game:
             if action == "quit": history_running = False; self.running = False
             elif action == "Back": self.game_state, history_running = "main_menu", False
 
-            self._draw_menu_background(f"History for {self.user_name}")
-            
-            if self.player_history_data:
-                y_pos = 180
-                data = self.player_history_data
-                
-                def draw_line(label, value, y):
-                    label_surf = info_font.render(label, True, WHITE)
-                    value_surf = value_font.render(value, True, YELLOW)
-                    self.screen.blit(label_surf, (150, y))
-                    self.screen.blit(value_surf, (600, y))
-
-                draw_line("Total Sessions Played:", str(data['total_sessions']), y_pos)
-                draw_line("Total Levels Completed:", str(data['total_levels_played']), y_pos + 50)
-                
-                playtime_min = data['total_playtime_seconds'] / 60
-                draw_line("Total Playtime:", f"{playtime_min:.1f} minutes", y_pos + 100)
-                
-                draw_line("Avg Collisions / Level:", f"{data['avg_collisions_per_level']:.2f}", y_pos + 150)
-                draw_line("Avg Grip Stability (CoV%):", f"{data['avg_grip_cov']:.2f}%", y_pos + 200)
-
-                levels_played_text = ", ".join([f"{lvl}: {count}" for lvl, count in data['levels_by_difficulty'].items()])
-                if not levels_played_text: levels_played_text = "None"
-                draw_line("Levels Played Breakdown:", levels_played_text, y_pos + 250)
-
-            else:
-                no_data_surf = info_font.render("No historical data found for this player.", True, RED)
-                self.screen.blit(no_data_surf, no_data_surf.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2)))
-
-            back_button.draw(self.screen)
-            pygame.display.flip()
+            self._update_menu_buttons(buttons, button_states)
 
     def _show_settings_menu(self):
         pygame.display.set_caption("Settings")
-        button_font = pygame.font.Font(None, 50)
-        music_button = Button(SCREEN_WIDTH/2 - 150, 250, 300, 80, "", button_font, WHITE, YELLOW)
-        back_button = Button(SCREEN_WIDTH/2 - 150, 350, 300, 80, "Back", button_font, WHITE, GREEN)
-        buttons = [music_button, back_button]
+        button_font = self.fonts[50]
+        buttons = self._menu_buttons("settings", lambda: [Button(SCREEN_WIDTH/2 - 150, 250, 300, 80, "", button_font, WHITE, YELLOW), Button(SCREEN_WIDTH/2 - 150, 350, 300, 80, "Back", button_font, WHITE, GREEN)])
+        music_button = buttons[0]
+        self._draw_menu_background("Settings")
+        self._cache_menu_background()
+        button_states = [None] * len(buttons)
         settings_running = True
         while settings_running:
-            self.clock.tick(60)
             music_button.text = f"Music: {'ON' if self.music_enabled else 'OFF'}"
             mouse_pos = pygame.mouse.get_pos()
             for button in buttons: button.check_hover(mouse_pos)
@@ -258,177 +465,261 @@ class Game:
             if action == "quit": settings_running = False; self.running = False
             elif action == music_button.text: self.music_enabled = not self.music_enabled
             elif action == "Back": self.game_state, settings_running = "main_menu", False
-            self._draw_menu_background("Settings")
-            for button in buttons: button.draw(self.screen)
-            pygame.display.flip()
+            self._update_menu_buttons(buttons, button_states)
 
     def _ask_to_continue(self):
         pygame.display.set_caption("Level Complete!")
-        button_font = pygame.font.Font(None, 50)
-        buttons = [Button(SCREEN_WIDTH/2 - 220, 400, 200, 80, "Continue", button_font, WHITE, GREEN), Button(SCREEN_WIDTH/2 + 20, 400, 200, 80, "End & Report", button_font, WHITE, BLUE)]
+        button_font = self.fonts[50]
+        buttons = self._menu_buttons("ask_continue", lambda: [Button(SCREEN_WIDTH/2 - 220, 400, 200, 80, "Continue", button_font, WHITE, GREEN), Button(SCREEN_WIDTH/2 + 20, 400, 200, 80, "End & Report", button_font, WHITE, BLUE)])
+        self._draw_menu_background(" ")
+        continue_text_surf = self._render(self.title_font, f"Continue to {self.level_sequence[self.current_level_index]}?", WHITE)
+        self.screen.blit(continue_text_surf, continue_text_surf.get_rect(center=(SCREEN_WIDTH / 2, 250)))
+        self._cache_menu_background()
+        button_states = [None] * len(buttons)
         ask_running = True
         while ask_running:
-            self.clock.tick(60)
             mouse_pos = pygame.mouse.get_pos()
             for button in buttons: button.check_hover(mouse_pos)
             action = self._handle_menu_events(buttons)
             if action == "quit": ask_running = False; self.running = False
             elif action == "Continue": self.game_state, ask_running = "playing", False
             elif action == "End & Report": self.game_state, ask_running = "generate_report", False
-            self._draw_menu_background(" ") 
-            title_font = pygame.font.Font(None, 74)
-            continue_text_surf = title_font.render(f"Continue to {self.level_sequence[self.current_level_index]}?", True, WHITE)
-            continue_text_rect = continue_text_surf.get_rect(center=(SCREEN_WIDTH / 2, 250))
-            self.screen.blit(continue_text_surf, continue_text_rect)
-            for button in buttons: button.draw(self.screen)
-            pygame.display.flip()
+            self._update_menu_buttons(buttons, button_states)
             
+    def _build_level(self, level_name):
+        """Locates the start and hole and rasterizes the static layer of a level once; later plays reuse the result."""
+        level_grid = LEVEL_GRIDS[level_name]
+        player_start_pos, hole = None, None
+        
+        start_tiles, hole_tiles = np.argwhere(level_grid == ord('P')).tolist(), np.argwhere(level_grid == ord('H')).tolist()
+        if start_tiles: r, c = start_tiles[-1]; player_start_pos = (c * TILE_SIZE + TILE_SIZE//2, r * TILE_SIZE + TILE_SIZE//2)
+        if hole_tiles: r, c = hole_tiles[-1]; hole = Hole(c * TILE_SIZE + TILE_SIZE//2, r * TILE_SIZE + TILE_SIZE//2)
+        
+        if player_start_pos is None: print(f"Error: No player start found in level {level_name}"); return None
+        if hole is None: print(f"Error: No hole found in level {level_name}"); return None
+
+        # Walls and the hole never move, so rasterize them once into a single layer
+        static_layer = build_wall_layer(WALL_MASKS[level_name], TILE_SIZE)
+        static_layer.blit(hole.image, hole.rect)
+        
+        start_vec, hole_vec = pygame.math.Vector2(player_start_pos), pygame.math.Vector2(hole.rect.center)
+        shortest_path = start_vec.distance_to(hole_vec) * 1.5
+        
+        self._level_cache[level_name] = (player_start_pos, hole, static_layer, shortest_path)
+        return self._level_cache[level_name]
+
     def _play_level(self, level_name):
         pygame.display.set_caption(f"Maze Game - {level_name}")
+        level = self._level_cache.get(level_name) or self._build_level(level_name)
+        if level is None: self.game_state = "main_menu"; return
+        player_start_pos, hole, static_layer, shortest_path = level
+        wall_mask = WALL_MASKS[level_name]
+        particles = self.particles
+        particles.clear()
+
         try:
-            game_video = Video("assets/BackgroundVid.mp4") if os.path.exists("assets/BackgroundVid.mp4") else None
+            game_video = None
+            if os.path.exists("assets/BackgroundVid.mp4"):
+                from pyvidplayer2 import Video # Only loaded when there is a video to play
+                game_video = Video("assets/BackgroundVid.mp4")
             if self.music_enabled and os.path.exists("assets/GameMusic.mp3"): pygame.mixer.music.load("assets/GameMusic.mp3"); pygame.mixer.music.play(-1)
         except Exception as e: game_video = None; print(f"Warning: Video/music not loaded. {e}")
         
-        level_map = LEVELS[level_name]
-        barriers, all_sprites, particles = pygame.sprite.Group(), pygame.sprite.Group(), pygame.sprite.Group()
-        player_start_pos, hole = None, None
-        
-        for r, row in enumerate(level_map):
-            for c, tile in enumerate(row):
-                x, y = c * TILE_SIZE, r * TILE_SIZE
-                if tile == 'W': barriers.add(Barrier(x, y, TILE_SIZE, TILE_SIZE))
-                elif tile == 'P': player_start_pos = (x + TILE_SIZE//2, y + TILE_SIZE//2)
-                elif tile == 'H': hole = Hole(x + TILE_SIZE//2, y + TILE_SIZE//2)
-        
-        all_sprites.add(barriers)
-        if player_start_pos is None: print(f"Error: No player start found in level {level_name}"); self.game_state = "main_menu"; return
-        if hole is None: print(f"Error: No hole found in level {level_name}"); self.game_state = "main_menu"; return
-        all_sprites.add(hole)
+        if game_video:
+            # Frames are decoded on their own thread so a slow decode can't stretch a game frame
+            self._video_frame, video_stop = None, threading.Event()
+            video_thread = threading.Thread(target=self._video_decode_loop, args=(game_video, video_stop), name="video-decoder", daemon=True)
+            video_thread.start()
+
+        # The opaque frame blitted every game frame. With a video it is re-composited only when the decoder yields a new frame.
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill(BLACK)
+        background.blit(static_layer, (0, 0))
         
         player = Ball(player_start_pos[0], player_start_pos[1])
         player_velocity = pygame.math.Vector2(0, 0)
         target_velocity = pygame.math.Vector2(0, 0)
-        
-        start_vec, hole_vec = pygame.math.Vector2(player_start_pos), pygame.math.Vector2(hole.rect.center)
-        shortest_path = start_vec.distance_to(hole_vec) * 1.5
 
-        self.current_level_metrics = {"LevelName": level_name, "Duration": 0, "Max_FSR": 0, "Min_FSR_Move": MAX_FSR_VALUE, "FSR_Readings_Move": [], "Grip_Lapses": 0, "Collision_Count": 0, "Path_Points": [player.rect.center], "Shortest_Path_Length": shortest_path}
-        start_time, level_running = time.time(), True
+        # Centre of the ball on every frame, written into a preallocated buffer rather than a growing list of tuples
+        path_points = np.empty((PATH_BUFFER_FRAMES, 2), dtype=np.int32)
+        path_points[0] = player.rect.center
+        path_count = 1
+        # FSR readings taken while moving, same scheme; their max/min are reduced once at the end of the level
+        fsr_readings = np.empty(PATH_BUFFER_FRAMES, dtype=np.float64)
+        fsr_count = 0
+
+        self.current_level_metrics = {"LevelName": level_name, "Duration": 0, "Max_FSR": 0, "Min_FSR_Move": MAX_FSR_VALUE, "FSR_Readings_Move": fsr_readings[:0], "Grip_Lapses": 0, "Collision_Count": 0, "Path_Points": path_points[:path_count], "Shortest_Path_Length": shortest_path}
+        hole_x, hole_y = hole.rect.center
+        # Bound to locals once: the loop below reads them many times a frame, and the collision count is stored at the end
+        metrics, player_rect, collision_count = self.current_level_metrics, player.rect, 0
+        self._timer_secs = -1 # Force the HUD timer to redraw from 00:00
+        start_time, level_running = time.monotonic(), True # Monotonic: level durations can't jump with the wall clock
+        # Screen areas drawn over the background last frame; empty means the whole screen must be redrawn
+        drawn_rects, full_redraw = [], True
         
         while level_running:
             dt = self.clock.tick(60) / 1000.0
             dt = min(dt, 0.1)
+            now = time.monotonic() # Read once per frame, shared by the completion check and the HUD timer
             hardware_connected = self._read_hardware_data()
             
             if hardware_connected:
-                tilt_x = clamp(self.accel_data[0] / TILT_SENSITIVITY, -1, 1)
-                tilt_y = clamp(self.accel_data[1] / TILT_SENSITIVITY, -1, 1)
-                if self.current_fsr > self.fsr_threshold: target_velocity.x = tilt_x * PLAYER_SPEED; target_velocity.y = tilt_y * PLAYER_SPEED
+                if self.current_fsr > self.fsr_threshold:
+                    # Tilt maps linearly onto speed, capped at PLAYER_SPEED in either direction (clamp inlined)
+                    vx, vy = self.accel_data[0] * TILT_TO_SPEED, self.accel_data[1] * TILT_TO_SPEED
+                    target_velocity.x = PLAYER_SPEED if vx > PLAYER_SPEED else -PLAYER_SPEED if vx < -PLAYER_SPEED else vx
+                    target_velocity.y = PLAYER_SPEED if vy > PLAYER_SPEED else -PLAYER_SPEED if vy < -PLAYER_SPEED else vy
                 else: target_velocity.x = 0; target_velocity.y = 0
-                if target_velocity.length() > 0:
-                    self.current_level_metrics["FSR_Readings_Move"].append(self.current_fsr)
-                    self.current_level_metrics["Max_FSR"] = max(self.current_level_metrics["Max_FSR"], self.current_fsr)
-                    self.current_level_metrics["Min_FSR_Move"] = min(self.current_level_metrics["Min_FSR_Move"], self.current_fsr)
             else:
                 keys = pygame.key.get_pressed()
                 target_velocity.x = (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * PLAYER_SPEED
                 target_velocity.y = (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * PLAYER_SPEED
-                if target_velocity.length() > 0:
-                    sim_fsr = random.uniform(FSR_THRESHOLD + 200, MAX_FSR_VALUE - 500)
-                    self.current_fsr = sim_fsr
-                    self.current_level_metrics["FSR_Readings_Move"].append(sim_fsr)
-                    self.current_level_metrics["Max_FSR"] = max(self.current_level_metrics["Max_FSR"], sim_fsr)
-                    self.current_level_metrics["Min_FSR_Move"] = min(self.current_level_metrics["Min_FSR_Move"], sim_fsr)
+                if target_velocity.x or target_velocity.y: self.current_fsr = random.uniform(FSR_THRESHOLD + 200, MAX_FSR_VALUE - 500)
                 else: self.current_fsr = 0
 
-            player_velocity = player_velocity.lerp(target_velocity, PLAYER_ACCELERATION)
+            if target_velocity.x or target_velocity.y:
+                if fsr_count == len(fsr_readings): fsr_readings = np.concatenate((fsr_readings, np.empty_like(fsr_readings)))
+                fsr_readings[fsr_count] = self.current_fsr
+                fsr_count += 1
+
+            # Same as lerp(), but in place so no new Vector2 is allocated every frame
+            player_velocity.x += (target_velocity.x - player_velocity.x) * PLAYER_ACCELERATION
+            player_velocity.y += (target_velocity.y - player_velocity.y) * PLAYER_ACCELERATION
             for event in pygame.event.get():
                 if event.type == pygame.QUIT: level_running = False; self.running = False
+                elif event.type == pygame.WINDOWEXPOSED: full_redraw = True
 
-            old_x, old_y = player.rect.x, player.rect.y
+            old_x, old_y = player_rect.x, player_rect.y
             
-            player.rect.x += player_velocity.x * dt
-            x_collisions = pygame.sprite.spritecollide(player, barriers, False)
-            if x_collisions: player.rect.x = old_x; player_velocity.x *= -PLAYER_BOUNCINESS; self.current_level_metrics["Collision_Count"] += 1
+            player_rect.x += player_velocity.x * dt
+            x_collisions = hits_wall(player_rect, wall_mask)
+            if x_collisions: player_rect.x = old_x; player_velocity.x *= -PLAYER_BOUNCINESS; collision_count += 1
             
-            player.rect.y += player_velocity.y * dt
-            y_collisions = pygame.sprite.spritecollide(player, barriers, False)
-            if y_collisions: player.rect.y = old_y; player_velocity.y *= -PLAYER_BOUNCINESS; self.current_level_metrics["Collision_Count"] += 1
+            player_rect.y += player_velocity.y * dt
+            y_collisions = hits_wall(player_rect, wall_mask)
+            if y_collisions: player_rect.y = old_y; player_velocity.y *= -PLAYER_BOUNCINESS; collision_count += 1
             
-            self.current_level_metrics["Path_Points"].append(player.rect.center)
+            if path_count == len(path_points): path_points = np.concatenate((path_points, np.empty_like(path_points))) # Long level: double the buffer
+            path_points[path_count] = player_rect.center
+            path_count += 1
             
-            if pygame.math.Vector2(player.rect.center).distance_to(hole.rect.center) < 15:
-                self.current_level_metrics["Duration"] = time.time() - start_time
-                database.save_level_result(self.session_id, self.current_level_metrics)
+            dx, dy = player_rect.centerx - hole_x, player_rect.centery - hole_y
+            if dx * dx + dy * dy < 225: # Within 15 px of the hole centre, compared squared to skip the sqrt
+                metrics["Duration"], metrics["Collision_Count"] = now - start_time, collision_count
+                metrics["Path_Points"] = path_points[:path_count] # A view; each level gets a fresh buffer
+                metrics["FSR_Readings_Move"] = fsr_moving = fsr_readings[:fsr_count]
+                if fsr_count:
+                    # float64 holds the simulated readings exactly; hardware readings are whole ADC counts, reported as ints
+                    fsr_value = int if self.ser else float
+                    metrics["Max_FSR"] = fsr_value(fsr_moving.max())
+                    metrics["Min_FSR_Move"] = fsr_value(fsr_moving.min())
+                self._pending_saves.append(self._level_saver.submit(database.save_level_result, self.session_id, metrics.copy()))
                 self.current_level_index += 1
                 if self.current_level_index >= len(self.level_sequence): self.game_state = "generate_report"
                 else: self.game_state = "ask_continue"
                 level_running = False
             
-            if player_velocity.length() > 20 and random.random() < 0.5:
-                particles.add(Particle(player.rect.centerx, player.rect.centery, YELLOW, random.randint(2, 5), (-player_velocity.x * 0.1, -player_velocity.y * 0.1)))
+            if player_velocity.length_squared() > 400 and random.random() < 0.5: # Faster than 20 px/s
+                particles.emit(player_rect.centerx, player_rect.centery, YELLOW, random.randint(2, 5), (-player_velocity.x * 0.1, -player_velocity.y * 0.1))
             if x_collisions or y_collisions:
-                for _ in range(10): particles.add(Particle(player.rect.centerx, player.rect.centery, RED, random.randint(3, 7), (random.uniform(-3, 3), random.uniform(-3, 3))))
+                for _ in range(10): particles.emit(player_rect.centerx, player_rect.centery, RED, random.randint(3, 7), (random.uniform(-3, 3), random.uniform(-3, 3)))
 
             particles.update()
-            if game_video: game_video.draw(self.screen, (0, 0), force_draw=False)
-            else: self.screen.fill(BLACK)
-            
-            all_sprites.draw(self.screen)
-            particles.draw(self.screen)
-            player.draw_with_shadow(self.screen)
-            self._draw_hud(start_time)
-            pygame.display.flip()
+            if game_video:
+                with self._video_lock: video_frame, self._video_frame = self._video_frame, None
+                if video_frame is not None: # Otherwise the background still holds the last frame
+                    background.blit(video_frame, (0, 0))
+                    background.blit(static_layer, (0, 0))
+                    full_redraw = True
+            if full_redraw: self.screen.blit(background, (0, 0))
+            else: self.screen.blits([(background, rect, rect) for rect in drawn_rects], doreturn=0) # Erase last frame's sprites and HUD
+
+            last_drawn_rects, drawn_rects = drawn_rects, []
+            particle_area = particles.draw(self.screen)
+            if particle_area: drawn_rects.append(particle_area)
+            drawn_rects.append(player.draw_with_shadow(self.screen))
+            drawn_rects += self._draw_hud(now - start_time)
+
+            # Only the ball, particles and HUD change between video frames, so present just those few small areas
+            if full_redraw: pygame.display.flip(); full_redraw = False
+            else: pygame.display.update(last_drawn_rects + drawn_rects)
 
         pygame.mixer.music.stop()
-        if game_video: game_video.close()
-
-    def _draw_hud(self, start_time):
-        elapsed_time = time.time() - start_time
-        mins, secs = int(elapsed_time // 60), int(elapsed_time % 60)
-        timer_text = f"{mins:02}:{secs:02}"
-        self.screen.blit(self.hud_font.render(timer_text, True, WHITE), TIMER_POS)
-        
-        self.screen.blit(self.hud_font.render("Grip:", True, WHITE), (GRIP_METER_POS[0] - 70, GRIP_METER_POS[1] - 4))
-        pygame.draw.rect(self.screen, GRIP_METER_BG_COLOR, pygame.Rect(GRIP_METER_POS, GRIP_METER_SIZE))
-        fill_ratio = clamp(self.current_fsr / MAX_FSR_VALUE, 0, 1)
-        pygame.draw.rect(self.screen, GRIP_METER_FILL_COLOR, pygame.Rect(GRIP_METER_POS[0], GRIP_METER_POS[1], GRIP_METER_SIZE[0] * fill_ratio, GRIP_METER_SIZE[1]))
-        threshold_x = GRIP_METER_POS[0] + (FSR_THRESHOLD / MAX_FSR_VALUE) * GRIP_METER_SIZE[0]
-        pygame.draw.line(self.screen, GRIP_METER_THRESHOLD_COLOR, (threshold_x, GRIP_METER_POS[1]), (threshold_x, GRIP_METER_POS[1] + GRIP_METER_SIZE[1]), 2)
+        if game_video:
+            video_stop.set(); video_thread.join()
+            game_video.close()
+
+    def _video_decode_loop(self, video, stop):
+        """Runs on the decoder thread: advances the background video and publishes each new frame for _play_level."""
+        while not stop.is_set():
+            if video.update():
+                with self._video_lock: self._video_frame = video.frame_surf
+            else: stop.wait(VIDEO_POLL_INTERVAL) # Next frame isn't due yet
+
+    def _build_grip_meter(self):
+        """Pre-renders the empty and completely full grip meter, each with the threshold marker drawn on top."""
+        threshold_x = (FSR_THRESHOLD / MAX_FSR_VALUE) * GRIP_METER_SIZE[0]
+        meters = []
+        for fill_color in (GRIP_METER_BG_COLOR, GRIP_METER_FILL_COLOR):
+            meter = pygame.Surface(GRIP_METER_SIZE).convert()
+            meter.fill(fill_color)
+            pygame.draw.line(meter, GRIP_METER_THRESHOLD_COLOR, (threshold_x, 0), (threshold_x, GRIP_METER_SIZE[1]), 2)
+            meters.append(meter)
+        return meters
+
+    def _draw_hud(self, elapsed_time):
+        elapsed_secs = int(elapsed_time)
+        if elapsed_secs != self._timer_secs:
+            # The text only changes once a second; rendered directly so 3600 distinct timer strings never churn _render's cache
+            self._timer_secs = elapsed_secs
+            minutes, seconds = divmod(elapsed_secs, 60)
+            self._timer_surf = self.hud_font.render(f"{minutes:02}:{seconds:02}", True, WHITE).convert_alpha()
+        
+        # The empty meter, then the filled part cut from the pre-rendered full one; the threshold marker is baked into both
+        fill_width = clamp(self.current_fsr * FSR_TO_METER_WIDTH, 0, GRIP_METER_SIZE[0])
+        hud_rects = [self.screen.blit(self._grip_meter_empty, GRIP_METER_POS)]
+        self.screen.blit(self._grip_meter_full, GRIP_METER_POS, (0, 0, fill_width, GRIP_METER_SIZE[1]))
         
         status_text = "Hardware: Connected" if self.ser else "Hardware: Simulated"
         status_color = GREEN if self.ser else YELLOW
-        self.screen.blit(self.hud_font.render(status_text, True, status_color), (SCREEN_WIDTH - 250, 10))
+        # The HUD labels never overlap, so blit them in one batched call
+        hud_rects += self.screen.blits([
+            (self._timer_surf, TIMER_POS),
+            (self._render(self.hud_font, "Grip:", WHITE), (GRIP_METER_POS[0] - 70, GRIP_METER_POS[1] - 4)),
+            (self._render(self.hud_font, status_text, status_color), (SCREEN_WIDTH - 250, 10))
+        ])
         
         if self.ser:
             bar_width, bar_height = 100, 10; center_x = SCREEN_WIDTH // 2
             x_tilt = clamp(self.accel_data[0] / 8000, -1, 1)
-            pygame.draw.rect(self.screen, (100, 100, 100), (center_x - bar_width//2, 40, bar_width, bar_height))
+            hud_rects.append(pygame.draw.rect(self.screen, (100, 100, 100), (center_x - bar_width//2, 40, bar_width, bar_height)))
             pygame.draw.rect(self.screen, RED, (center_x, 40, x_tilt * bar_width//2, bar_height))
             y_tilt = clamp(self.accel_data[1] / 8000, -1, 1)
-            pygame.draw.rect(self.screen, (100, 100, 100), (center_x - bar_width//2, 60, bar_width, bar_height))
+            hud_rects.append(pygame.draw.rect(self.screen, (100, 100, 100), (center_x - bar_width//2, 60, bar_width, bar_height)))
             pygame.draw.rect(self.screen, BLUE, (center_x, 60, y_tilt * bar_width//2, bar_height))
+        return hud_rects # Every area the HUD drew on, for the level loop's dirty-rect update
 
-    def _create_performance_chart(self):
+    def _create_performance_chart(self, level_covs):
         if not self.completed_levels_metrics:
             return None
 
         labels = [m['LevelName'] for m in self.completed_levels_metrics]
         collisions = [m['Collision_Count'] for m in self.completed_levels_metrics]
         
-        level_covs = []
-        for metrics in self.completed_levels_metrics:
-            if len(metrics['FSR_Readings_Move']) > 1:
-                mean_fsr = statistics.mean(metrics['FSR_Readings_Move'])
-                stdev_fsr = statistics.stdev(metrics['FSR_Readings_Move'])
-                level_covs.append((stdev_fsr / mean_fsr) * 100 if mean_fsr > 0 else 0)
-            else:
-                level_covs.append(0)
 
         x = range(len(labels))
         width = 0.35
-        fig, ax1 = plt.subplots(figsize=(8, 5))
+        # One figure serves every report of the session; only its contents are redrawn
+        if self._chart_fig is None:
+            # The report modules are heavy to import and most runs only need them once, at the very end
+            from matplotlib.figure import Figure # Used without pyplot: no GUI backend and no global figure to close
+            self._chart_fig = Figure(figsize=(8, 5))
+            ax1 = self._chart_fig.subplots()
+            self._chart_axes = (ax1, ax1.twinx())
+        fig, (ax1, ax2) = self._chart_fig, self._chart_axes
+        ax1.clear(); ax2.clear()
+        # clear() moves the twin axis' label back to the left (and, on older matplotlib, its ticks and background too)
+        ax2.yaxis.tick_right(); ax2.yaxis.set_label_position("right"); ax2.patch.set_visible(False)
         
         ax1.bar(x, collisions, width, label='Collisions', color='skyblue')
         ax1.set_ylabel('Total Collisions', color='skyblue')
@@ -437,7 +728,6 @@ class Game:
         ax1.set_xticks(x)
         ax1.set_xticklabels(labels)
         
-        ax2 = ax1.twinx()
         ax2.plot(x, level_covs, label='Grip CoV (%)', color='red', marker='o')
         ax2.set_ylabel('Grip CoV (%)', color='red')
         ax2.tick_params(axis='y', labelcolor='red')
@@ -445,12 +735,19 @@ class Game:
         fig.suptitle('Performance Summary: Collisions and Grip Stability')
         fig.tight_layout(rect=[0, 0.03, 1, 0.95])
         
-        chart_filename = "performance_chart.png"
-        plt.savefig(chart_filename)
-        plt.close()
-        return chart_filename
+        # Rendered into memory and handed straight to the PDF (see pdf_image() for the legacy fpdf case)
+        chart_png = io.BytesIO()
+        fig.savefig(chart_png, format="png")
+        chart_png.seek(0)
+        return chart_png
+
+    def _wait_for_level_saves(self):
+        """Blocks until every queued save_level_result call has committed."""
+        for future in self._pending_saves: future.result()
+        self._pending_saves.clear()
 
     def _generate_report(self):
+        self._wait_for_level_saves()
         self.completed_levels_metrics = database.get_session_results(self.session_id)
         if not self.completed_levels_metrics: 
             print("No completed level data found in the database for this session.")
@@ -459,14 +756,10 @@ class Game:
         historical_summary = database.get_player_history(self.player_id)
         
         level_specific_data = []
-        for metrics in self.completed_levels_metrics:
-            cov = 0
-            if len(metrics['FSR_Readings_Move']) > 1:
-                mean_fsr = statistics.mean(metrics['FSR_Readings_Move'])
-                stdev_fsr = statistics.stdev(metrics['FSR_Readings_Move'])
-                cov = (stdev_fsr / mean_fsr) * 100 if mean_fsr > 0 else 0
+        level_covs = grip_covs([m['FSR_Readings_Move'] for m in self.completed_levels_metrics])
+        for metrics, cov in zip(self.completed_levels_metrics, level_covs):
             
-            path_len = sum(pygame.math.Vector2(p1).distance_to(p2) for p1, p2 in zip(metrics["Path_Points"][:-1], metrics["Path_Points"][1:]))
+            path_len = path_length(metrics["Path_Points"])
             shortest_path = metrics["Shortest_Path_Length"]
             path_eff = (shortest_path / path_len) * 100 if path_len > 0 else 0
 
@@ -478,9 +771,10 @@ class Game:
                 "path_eff": path_eff
             })
 
-        avg_cov = statistics.mean([d['cov'] for d in level_specific_data]) if level_specific_data else 0
-        avg_collisions = statistics.mean([d['collisions'] for d in level_specific_data]) if level_specific_data else 0
+        avg_cov = math.fsum(d['cov'] for d in level_specific_data) / len(level_specific_data) if level_specific_data else 0
+        avg_collisions = math.fsum(d['collisions'] for d in level_specific_data) / len(level_specific_data) if level_specific_data else 0
         
+        from fpdf import FPDF
         pdf = FPDF()
         pdf.add_page()
         pdf.set_font("Arial", 'B', 16)
@@ -496,81 +790,44 @@ class Game:
         
         pdf.set_font("Arial", 'B', 14)
         pdf.cell(0, 10, txt="This Session's Performance", ln=True)
-        pdf.set_font("Arial", 'B', 10)
-        pdf.cell(40, 8, 'Level', 1, 0, 'C')
-        pdf.cell(40, 8, 'Duration (s)', 1, 0, 'C')
-        pdf.cell(35, 8, 'Collisions', 1, 0, 'C')
-        pdf.cell(35, 8, 'Grip CoV (%)', 1, 0, 'C')
-        pdf.cell(40, 8, 'Path Efficiency (%)', 1, 1, 'C')
-        pdf.set_font("Arial", size=10)
-        for data in level_specific_data:
-            pdf.cell(40, 8, data['name'], 1, 0, 'C')
-            pdf.cell(40, 8, f"{data['duration']:.2f}", 1, 0, 'C')
-            pdf.cell(35, 8, str(data['collisions']), 1, 0, 'C')
-            pdf.cell(35, 8, f"{data['cov']:.2f}", 1, 0, 'C')
-            pdf.cell(40, 8, f"{data['path_eff']:.2f}", 1, 1, 'C')
+        pdf_table(pdf, (40, 40, 35, 35, 40), ('Level', 'Duration (s)', 'Collisions', 'Grip CoV (%)', 'Path Efficiency (%)'),
+                  [(data['name'], f"{data['duration']:.2f}", str(data['collisions']), f"{data['cov']:.2f}", f"{data['path_eff']:.2f}") for data in level_specific_data])
         pdf.ln(10)
         
         if historical_summary and historical_summary['total_sessions'] > 0:
             pdf.set_font("Arial", 'B', 14)
             pdf.cell(0, 10, txt="Player's Historical Summary (All Time)", ln=True)
-            pdf.set_font("Arial", 'B', 10)
-            pdf.cell(100, 8, 'Lifetime Metric', 1, 0, 'C')
-            pdf.cell(90, 8, 'Value', 1, 1, 'C')
-            pdf.set_font("Arial", size=10)
-            pdf.cell(100, 8, 'Total Sessions Played', 1, 0, 'L')
-            pdf.cell(90, 8, str(historical_summary['total_sessions']), 1, 1, 'C')
-
             playtime_min = historical_summary['total_playtime_seconds'] / 60
-            pdf.cell(100, 8, 'Total Playtime (all sessions)', 1, 0, 'L')
-            pdf.cell(90, 8, f"{playtime_min:.1f} minutes", 1, 1, 'C')
-            
-            pdf.cell(100, 8, 'Lifetime Avg Collisions / Level', 1, 0, 'L')
-            pdf.cell(90, 8, f"{historical_summary['avg_collisions_per_level']:.2f}", 1, 1, 'C')
-
-            pdf.cell(100, 8, 'Lifetime Avg Grip Stability (CoV%)', 1, 0, 'L')
-            pdf.cell(90, 8, f"{historical_summary['avg_grip_cov']:.2f}%", 1, 1, 'C')
+            pdf_table(pdf, (100, 90), ('Lifetime Metric', 'Value'), [
+                ('Total Sessions Played', str(historical_summary['total_sessions'])),
+                ('Total Playtime (all sessions)', f"{playtime_min:.1f} minutes"),
+                ('Lifetime Avg Collisions / Level', f"{historical_summary['avg_collisions_per_level']:.2f}"),
+                ('Lifetime Avg Grip Stability (CoV%)', f"{historical_summary['avg_grip_cov']:.2f}%"),
+            ], aligns=('L', 'C'))
             pdf.ln(10)
 
         pdf.set_font("Arial", 'B', 14)
         pdf.cell(0, 10, txt="This Session's Averages", ln=True)
-        pdf.set_font("Arial", 'B', 10)
-        pdf.cell(40, 8, 'Metric', 1, 0, 'C')
-        pdf.cell(40, 8, 'Average Value', 1, 1, 'C')
-        
-        pdf.set_font("Arial", size=10)
-        pdf.cell(40, 8, 'Collisions', 1, 0, 'C')
-        pdf.cell(40, 8, f"{avg_collisions:.2f}", 1, 1, 'C')
-        
-        pdf.cell(40, 8, 'Grip CoV (%)', 1, 0, 'C')
-        pdf.cell(40, 8, f"{avg_cov:.2f}", 1, 1, 'C')
-        
-        avg_path_eff = statistics.mean([d['path_eff'] for d in level_specific_data]) if level_specific_data else 0
-        pdf.cell(40, 8, 'Path Efficiency (%)', 1, 0, 'C')
-        pdf.cell(40, 8, f"{avg_path_eff:.2f}", 1, 1, 'C')
-        
+        avg_path_eff = math.fsum(d['path_eff'] for d in level_specific_data) / len(level_specific_data) if level_specific_data else 0
+        pdf_table(pdf, (40, 40), ('Metric', 'Average Value'),
+                  [('Collisions', f"{avg_collisions:.2f}"), ('Grip CoV (%)', f"{avg_cov:.2f}"), ('Path Efficiency (%)', f"{avg_path_eff:.2f}")])
         pdf.ln(10)
 
         pdf.set_font("Arial", 'B', 14)
         pdf.cell(0, 10, txt="This Session's Visual Summary", ln=True)
-        chart_filename = self._create_performance_chart()
-        if chart_filename:
-            pdf.image(chart_filename, x=15, y=None, w=180)
-            os.remove(chart_filename)
+        chart_png = self._create_performance_chart([d['cov'] for d in level_specific_data])
+        if chart_png:
+            pdf_image(pdf, chart_png, x=15, y=None, w=180)
         
         pdf.add_page()
         pdf.set_font("Arial", 'B', 14)
         pdf.cell(0, 10, txt="This Session's Qualitative Summary", ln=True)
         pdf.set_font("Arial", size=12)
         
-        summary_text = ""
-        if avg_cov < 15: summary_text += "Grip control was steady and consistent, indicating excellent force modulation. "
-        elif avg_cov < 25: summary_text += "Grip control was generally stable with some minor fluctuations. "
-        else: summary_text += "Grip control showed significant fluctuation, suggesting an opportunity to improve steadiness. "
-        
-        if avg_collisions < 5: summary_text += "Navigational accuracy was very high with minimal collisions. "
-        elif avg_collisions < 15: summary_text += "Navigation was effective with a moderate number of collisions. "
-        else: summary_text += "A high number of collisions suggests a focus on improving fine motor precision could be beneficial."
+        summary_text = " ".join((
+            GRIP_SUMMARIES[bisect.bisect_right(GRIP_SUMMARY_BOUNDS, avg_cov)],
+            COLLISION_SUMMARIES[bisect.bisect_right(COLLISION_SUMMARY_BOUNDS, avg_collisions)],
+        ))
         
         pdf.multi_cell(0, 8, txt=summary_text)
         pdf.ln(10)
@@ -0,0 +1,7 @@
+# migrate_fsr_blob.py
+import database
+
+if __name__ == "__main__":
+    print("This script will convert stored FSR readings from JSON to the compact binary format.")
+    database.migrate_fsr_readings_to_blob()
+    print("Migration complete.")
\ No newline at end of file
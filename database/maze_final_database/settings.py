@@ -2,6 +2,7 @@
 """
 Global game settings and constants for the NeuroGrip Maze Game.
 """
+import numpy as np
 
 # =============================================================================
 #  1. MASTER GAME SETTINGS
@@ -24,10 +25,15 @@ PLAYER_BOUNCINESS = 0.4         # NEW: How much velocity is retained after hitti
 CONSTANT_BALL_SPEED = 150
 ROTATION_SPEED = 200
 
+# --- Metrics Recording ---
+PATH_BUFFER_FRAMES = 60 * 60 * 5  # Path / FSR samples preallocated per level (5 minutes at 60 FPS); doubles if exceeded
+
 # =============================================================================
 #  3. HARDWARE SETTINGS
 # =============================================================================
 SERIAL_PORT = "COM5"            # ⚠️ Change to your ESP32's COM port
+SERIAL_BAUD = 115200            # Must match the ESP32 sketch's Serial.begin()
+SERIAL_READ_TIMEOUT = 0.05      # Seconds the sensor thread waits for data before re-checking for shutdown
 TILT_SENSITIVITY = 5000.0       # Lower = more sensitive tilt control
 MAX_TILT_VALUE = 20000.0        # Maximum expected tilt value
 FSR_THRESHOLD = 500             # The ADC value from an FSR needed to register a "grip"
@@ -45,6 +51,7 @@ YELLOW = (255, 255, 0)
 BUTTON_BG_COLOR = (70, 70, 150)
 BUTTON_SHADOW_COLOR = (40, 40, 90) # NEW: Added for button depth
 BARRIER_COLOR = (180, 0, 0)
+VIDEO_POLL_INTERVAL = 0.004 # Seconds the video decoder thread sleeps while the next frame isn't due yet
 
 # =============================================================================
 #  5. HUD (TIMER AND GRIP METER) SETTINGS
@@ -56,6 +63,13 @@ GRIP_METER_SIZE = (200, 20) # Width, Height
 GRIP_METER_BG_COLOR = (50, 50, 50)
 GRIP_METER_FILL_COLOR = YELLOW
 GRIP_METER_THRESHOLD_COLOR = RED
+TEXT_CACHE_SIZE = 256           # Rendered text surfaces kept before the cache is flushed
+MENU_IDLE_TIMEOUT_MS = 250      # Longest a menu sleeps waiting for input before re-checking
+
+# --- Particle Effects ---
+PARTICLE_CAPACITY = 1024        # Most particles alive at once; extra spawns are dropped
+PARTICLE_LIFESPAN = 60          # Frames a particle lives for
+PARTICLE_FADE_FRAMES = 30       # Particles fade out over their last this-many frames
 
 # =============================================================================
 #  6. LEVEL DEFINITIONS
@@ -96,25 +110,38 @@ LEVELS = {
         "W WWWWWWWW W                 W",
         "WWWWWWWWWWWWWWWWWWWWWWWWWWWWWW",
     ],
-  "Hard": [
+    "Hard": [
         "WWWWWWWWWWWWWWWWWWWWWWWWWWWWWW",
         "WP W   W   W W   W     W   H W",
         "W  W W W WWW W W W WWWWW WWW W",
         "WW W W W W   W W W W     W   W",
-        "W  W W W W WWW W W W WWWWW WWW W",
-        "W WW W W W W   W W   W     W",
+        "W  W W W W WWW W W W WWWWW WWW",
+        "W WW W W W W   W W   W     W W",
         "W W  W W W W WWWWWWWWW WWW W W",
         "W W WWW W  W  W   W W   W    W",
-        "W W W   WWWWWWW W W W W WWWWW W",
-        "W W W WWWW    W W W W W W     W",
-        "W W W W   WWWWW W W W W W WWWWW",
-        "W W W   W W     W W W W     W",
-        "W W W WWW W WWWWWWWWW WWWWWW  W",
-        "W     W                     W",
+        "W W W   WWWWWWW W W W W WWWWWW",
+        "W W W WWWW    W W W W W W    W",
+        "W W W W   WWWWW W W W W W WWWW",
+        "W W W   W W     W W W W     WW",
+        "W W W WWW W WWWWWWWWW WWWWWW W",
+        "W     W                     WW",
         "WWWWWWWWWWWWWWWWWWWWWWWWWWWWWW",
     ]
 }
 
+# Each level as a (rows, cols) uint8 grid of tile characters, built once at import so the maze
+# can be scanned with NumPy instead of character by character.
+def _level_grid(name, rows):
+    # Every level must fill the window exactly; a ragged row would leave a gap in the outer wall
+    width, height = len(LEVELS["Easy"][0]), len(LEVELS["Easy"])
+    bad_rows = [i for i, row in enumerate(rows) if len(row) != width]
+    if len(rows) != height or bad_rows:
+        raise ValueError(f"Level '{name}' must be {height} rows of {width} tiles (bad rows: {bad_rows})")
+    return np.frombuffer("".join(rows).encode("ascii"), dtype=np.uint8).reshape(height, width)
+
+LEVEL_GRIDS = {name: _level_grid(name, rows) for name, rows in LEVELS.items()}
+WALL_MASKS = {name: grid == ord('W') for name, grid in LEVEL_GRIDS.items()}
+
 
 # Screen dimensions are calculated automatically from the 'Easy' level layout
 SCREEN_WIDTH = len(LEVELS["Easy"][0]) * TILE_SIZE
@@ -1,13 +1,25 @@
 # sprites.py
 import pygame
-import random
-from settings import BUTTON_BG_COLOR, BUTTON_SHADOW_COLOR, WHITE, GREEN, RED, YELLOW, BARRIER_COLOR
+import numpy as np
+from settings import BUTTON_BG_COLOR, BUTTON_SHADOW_COLOR, WHITE, GREEN, BARRIER_COLOR
+from settings import PARTICLE_CAPACITY, PARTICLE_LIFESPAN, PARTICLE_FADE_FRAMES
+
+# Every surface load_or_fallback has produced, keyed by its arguments. Sprites never draw onto their image,
+# so all Ball/Hole instances and wall tiles of a given size share one converted surface.
+_SURFACE_CACHE: dict[tuple, pygame.Surface] = {}
+# Ball shadows depend only on the ball size, so every level's ball reuses the same one
+_SHADOW_CACHE: dict[tuple[int, int], pygame.Surface] = {}
 
 def load_or_fallback(path: str, size: tuple[int, int], shape: str = "circle", color: tuple[int, int, int] = (255, 255, 255)) -> pygame.Surface:
     """
     Utility function: Tries to load an image, else draws a fallback shape.
     It now correctly handles both PNG (with transparency) and JPG (without).
+    Each asset is decoded, converted and scaled once; later calls return the cached surface.
     """
+    key = (path, size, shape, color)
+    surf = _SURFACE_CACHE.get(key)
+    if surf is not None:
+        return surf
     try:
         image = pygame.image.load(path)
         # Use .convert_alpha() for PNGs, and the faster .convert() for everything else.
@@ -15,7 +27,8 @@ def load_or_fallback(path: str, size: tuple[int, int], shape: str = "circle", co
             image = image.convert_alpha()
         else:
             image = image.convert()
-        return pygame.transform.scale(image, size)
+        # Assets already authored at the requested size are used as-is
+        surf = image if image.get_size() == tuple(size) else pygame.transform.scale(image, size)
     except pygame.error:
         print(f"[Warning] Could not load {path}. Using fallback shape.")
         surf = pygame.Surface(size, pygame.SRCALPHA)
@@ -23,42 +36,49 @@ def load_or_fallback(path: str, size: tuple[int, int], shape: str = "circle", co
             pygame.draw.circle(surf, color, (size[0] // 2, size[1] // 2), size[0] // 2)
         elif shape == "rect":
             surf.fill(color)
-        return surf
+        surf = surf.convert_alpha() # Match the display format like the loaded images do
+    _SURFACE_CACHE[key] = surf
+    return surf
 
-class Ball(pygame.sprite.Sprite):
+class Ball:
     """Represents the player's ball in the game."""
     def __init__(self, x: int, y: int, size: tuple[int, int] = (20, 20)): # Reduced size for easier movement
-        super().__init__()
         self.image = load_or_fallback("assets/Ball.png", size, shape="circle", color=WHITE)
         self.rect = self.image.get_rect(center=(x, y))
         
         # Shadow setup
         self.shadow_offset = (5, 5)
-        shadow_size = (size[0] + 5, size[1] + 5) # Slightly larger shadow
-        self.shadow_surface = pygame.Surface(shadow_size, pygame.SRCALPHA)
-        pygame.draw.circle(self.shadow_surface, (0, 0, 0, 90), 
-                           (shadow_size[0] // 2, shadow_size[1] // 2), 
-                           shadow_size[0] // 2)
-
-    def draw_with_shadow(self, screen):
-        """Draws the shadow first, then the ball."""
+        self.shadow_surface = _SHADOW_CACHE.get(size)
+        if self.shadow_surface is None:
+            shadow_size = (size[0] + 5, size[1] + 5) # Slightly larger shadow
+            self.shadow_surface = pygame.Surface(shadow_size, pygame.SRCALPHA)
+            pygame.draw.circle(self.shadow_surface, (0, 0, 0, 90), 
+                               (shadow_size[0] // 2, shadow_size[1] // 2), 
+                               shadow_size[0] // 2)
+            _SHADOW_CACHE[size] = self.shadow_surface
+
+    def draw_with_shadow(self, screen) -> pygame.Rect:
+        """Draws the shadow first, then the ball. Returns the screen area covered by both."""
         shadow_pos = (self.rect.x + self.shadow_offset[0], self.rect.y + self.shadow_offset[1])
-        screen.blit(self.shadow_surface, shadow_pos)
-        screen.blit(self.image, self.rect)
+        return screen.blit(self.shadow_surface, shadow_pos).union(screen.blit(self.image, self.rect))
 
-class Hole(pygame.sprite.Sprite):
+class Hole:
     """Represents the goal hole in the maze."""
     def __init__(self, x: int, y: int, size: tuple[int, int] = (60, 60)):
-        super().__init__()
         self.image = load_or_fallback("assets/Hole.png", size, shape="circle", color=GREEN)
         self.rect = self.image.get_rect(center=(x, y))
 
-class Barrier(pygame.sprite.Sprite):
-    """Represents a single wall tile in the maze."""
-    def __init__(self, x: int, y: int, width: int, height: int):
-        super().__init__()
-        self.image = load_or_fallback("assets/Barrier.png", (width, height), shape="rect", color=BARRIER_COLOR)
-        self.rect = self.image.get_rect(topleft=(x, y))
+def build_wall_layer(wall_mask: np.ndarray, tile_size: int) -> pygame.Surface:
+    """
+    Rasterizes every wall tile of a level (the True cells of its WALL_MASKS grid) into one transparent surface
+    covering the whole maze, so a frame draws all walls with a single blit.
+    """
+    wall_image = load_or_fallback("assets/Barrier.png", (tile_size, tile_size), shape="rect", color=BARRIER_COLOR)
+    wall_rects = [pygame.Rect(c * tile_size, r * tile_size, tile_size, tile_size) for r, c in np.argwhere(wall_mask).tolist()]
+    rows, cols = wall_mask.shape
+    layer = pygame.Surface((cols * tile_size, rows * tile_size), pygame.SRCALPHA)
+    layer.blits([(wall_image, rect) for rect in wall_rects], doreturn=0)
+    return layer.convert_alpha()
 
 class Button:
     """A clickable UI button for menus with a shadow and press effect."""
@@ -71,20 +91,30 @@ class Button:
         self.hover_color = hover_color
         self.is_hovered = False
         self.is_pressed = False
+        self._surfaces, self._surfaces_text = {}, None
+
+    def _build_surfaces(self):
+        """Pre-renders the button once per (pressed, hovered) state so draw() is a single blit."""
+        offset = self.shadow_rect.x - self.rect.x
+        body_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        shadow_rect = body_rect.move(offset, offset)
+        self._surfaces = {}
+        for pressed in (False, True):
+            current_rect = shadow_rect if pressed else body_rect
+            for hovered in (False, True):
+                surf = pygame.Surface((self.rect.width + offset, self.rect.height + offset), pygame.SRCALPHA)
+                pygame.draw.rect(surf, BUTTON_SHADOW_COLOR, shadow_rect, border_radius=15)
+                pygame.draw.rect(surf, BUTTON_BG_COLOR, current_rect, border_radius=15)
+                text_surf = self.font.render(self.text, True, self.hover_color if hovered else self.base_color)
+                surf.blit(text_surf, text_surf.get_rect(center=current_rect.center))
+                self._surfaces[(pressed, hovered)] = surf.convert_alpha()
+        self._surfaces_text = self.text
 
     def draw(self, screen: pygame.Surface):
         """Draws the button onto the screen, handling hover and press states."""
-        current_rect = self.rect
-        if self.is_pressed:
-            current_rect = self.shadow_rect
-
-        pygame.draw.rect(screen, BUTTON_SHADOW_COLOR, self.shadow_rect, border_radius=15)
-        pygame.draw.rect(screen, BUTTON_BG_COLOR, current_rect, border_radius=15)
-
-        color = self.hover_color if self.is_hovered else self.base_color
-        text_surf = self.font.render(self.text, True, color)
-        text_rect = text_surf.get_rect(center=current_rect.center)
-        screen.blit(text_surf, text_rect)
+        if self._surfaces_text != self.text: # Labels such as the music toggle change at runtime
+            self._build_surfaces()
+        screen.blit(self._surfaces[(self.is_pressed, self.is_hovered)], self.rect.topleft)
 
     def check_hover(self, mouse_pos: tuple[int, int]):
         """Checks if the mouse is over the button."""
@@ -103,25 +133,83 @@ class Button:
         
         return False
 
-class Particle(pygame.sprite.Sprite):
-    """A small particle for visual effects."""
-    def __init__(self, x, y, color, size, velocity):
-        super().__init__()
-        self.image = pygame.Surface((size, size))
-        pygame.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
-        self.image.set_colorkey((0, 0, 0))
-        self.rect = self.image.get_rect(center=(x, y))
-        self.velocity = pygame.math.Vector2(velocity)
-        self.lifespan = 60
-        self.alpha = 255
+class ParticleSystem:
+    """
+    All live particles of a level, kept as parallel NumPy arrays instead of one Sprite each.
+    Every particle moves in one vectorized step and the whole set is drawn with a single blits() call.
+    """
+    # Pre-rendered fade steps per (color, size), shared by every level: _images[image_id][frames_left]
+    _images = []
+    _image_ids = {}
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY):
+        self.pos = np.zeros((capacity, 2), dtype=np.float32) # Top-left corner of each particle
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int16)
+        self.image_id = np.zeros(capacity, dtype=np.int16)
+        self.count = 0 # Live particles occupy the first `count` slots
+        self.max_size = 0 # Largest particle emitted so far, for the bounds returned by draw()
+
+    @classmethod
+    def _image_id_for(cls, color: tuple, size: int) -> int:
+        image_id = cls._image_ids.get((color, size))
+        if image_id is None:
+            # Alpha is baked into each step's pixels: no colorkey or surface alpha left for the blitter to combine
+            fade_steps = []
+            for frames_left in range(PARTICLE_FADE_FRAMES + 1):
+                step = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(step, (*color, 255 * frames_left // PARTICLE_FADE_FRAMES), (size // 2, size // 2), size // 2)
+                fade_steps.append(step.convert_alpha())
+            image_id = len(cls._images)
+            cls._images.append(fade_steps)
+            cls._image_ids[(color, size)] = image_id
+        return image_id
+
+    @classmethod
+    def preload(cls, color: tuple, sizes):
+        """Renders the fade steps for these sizes ahead of time, so the first emit of each never stalls a frame."""
+        for size in sizes: cls._image_id_for(color, size)
+
+    def emit(self, x: float, y: float, color: tuple, size: int, velocity: tuple[float, float]):
+        """Spawns a particle centred on (x, y). Once every slot is live, new particles are dropped."""
+        i = self.count
+        if i >= len(self.life): return
+        self.pos[i] = (x - size // 2, y - size // 2)
+        self.vel[i] = velocity
+        self.life[i] = PARTICLE_LIFESPAN
+        self.image_id[i] = self._image_id_for(color, size)
+        self.max_size = max(self.max_size, size)
+        self.count = i + 1
+
+    def clear(self):
+        """Frees every slot at once; the arrays are kept for reuse."""
+        self.count = 0
 
     def update(self):
-        self.rect.move_ip(self.velocity)
-        self.lifespan -= 1
-        
-        if self.lifespan < 30:
-            self.alpha = max(0, self.alpha - (255 / 30))
-            self.image.set_alpha(self.alpha)
+        n = self.count
+        if n == 0: return
+        self.pos[:n] += self.vel[:n]
+        self.life[:n] -= 1
+        alive = self.life[:n] > 0
+        if not alive.all():
+            # Compact the survivors to the front so the live slots stay contiguous
+            keep = np.flatnonzero(alive)
+            m = keep.size
+            self.pos[:m] = self.pos[keep]
+            self.vel[:m] = self.vel[keep]
+            self.life[:m] = self.life[keep]
+            self.image_id[:m] = self.image_id[keep]
+            self.count = m
 
-        if self.lifespan <= 0:
-            self.kill()
\ No newline at end of file
+    def draw(self, screen: pygame.Surface) -> pygame.Rect | None:
+        """Draws every live particle and returns a rect bounding them all, or None if there are none."""
+        n = self.count
+        if n == 0: return None
+        # Full alpha until the last PARTICLE_FADE_FRAMES frames, then one fade step per frame
+        fade = np.minimum(self.life[:n], PARTICLE_FADE_FRAMES).tolist()
+        images = self._images
+        screen.blits([(images[image_id][frames_left], pos)
+                      for image_id, frames_left, pos in zip(self.image_id[:n].tolist(), fade, self.pos[:n].tolist())], doreturn=0)
+        left, top = np.floor(self.pos[:n].min(axis=0)).tolist()
+        right, bottom = np.ceil(self.pos[:n].max(axis=0)).tolist()
+        return pygame.Rect(left, top, right - left + self.max_size, bottom - top + self.max_size)
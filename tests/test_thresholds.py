@@ -0,0 +1,92 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from thresholds import THRESHOLD_METRICS, THRESHOLDS_HISTORY, load_threshold_samples, save_threshold_samples
+
+
+class LoadThresholdSamplesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "normal_user_thresholds.npz")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _save(self, **arrays):
+        with open(self.filename, 'wb') as f:
+            np.savez(f, **arrays)
+
+    def assertEmptySamples(self, samples):
+        self.assertEqual(set(samples), set(THRESHOLD_METRICS))
+        for values in samples.values():
+            self.assertEqual(list(values), [])
+            self.assertEqual(values.maxlen, THRESHOLDS_HISTORY)
+
+    def test_missing_file_gives_empty_samples(self):
+        self.assertEmptySamples(load_threshold_samples(self.filename))
+
+    def test_empty_file_gives_empty_samples(self):
+        open(self.filename, 'wb').close()
+        self.assertEmptySamples(load_threshold_samples(self.filename))
+
+    def test_truncated_file_gives_empty_samples(self):
+        self._save(**{metric: np.arange(50, dtype=np.float64) for metric in THRESHOLD_METRICS})
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+        with open(self.filename, 'wb') as f:
+            f.write(data[:len(data) // 2])
+        self.assertEmptySamples(load_threshold_samples(self.filename))
+
+    def test_saved_samples_are_loaded(self):
+        self._save(avg_cov=np.array([1.5, 2.5]), avg_collisions=np.array([3.0]), avg_path_eff=np.array([80.0, 90.0]))
+        samples = load_threshold_samples(self.filename)
+        self.assertEqual(list(samples['avg_cov']), [1.5, 2.5])
+        self.assertEqual(list(samples['avg_collisions']), [3.0])
+        self.assertEqual(list(samples['avg_path_eff']), [80.0, 90.0])
+
+    def test_history_keeps_most_recent_sessions(self):
+        self._save(avg_cov=np.arange(THRESHOLDS_HISTORY + 10, dtype=np.float64))
+        samples = load_threshold_samples(self.filename)
+        self.assertEqual(len(samples['avg_cov']), THRESHOLDS_HISTORY)
+        self.assertEqual(samples['avg_cov'][0], 10.0)
+
+    def test_saved_samples_round_trip(self):
+        save_threshold_samples(self.filename, {'avg_cov': [1.0, 2.0], 'avg_collisions': [3.0], 'avg_path_eff': []})
+        samples = load_threshold_samples(self.filename)
+        self.assertEqual(list(samples['avg_cov']), [1.0, 2.0])
+        self.assertEqual(list(samples['avg_collisions']), [3.0])
+        self.assertEqual(list(samples['avg_path_eff']), [])
+        self.assertFalse(os.path.exists(self.filename + ".tmp"))
+
+    def test_legacy_text_file_is_imported(self):
+        with open(os.path.join(self.tmp.name, "normal_user_thresholds.txt"), 'w') as f:
+            f.write("avg_cov:39.5,40.5\navg_collisions:47.0,0.5\navg_path_eff:84.5,86.5\n")
+        samples = load_threshold_samples(self.filename)
+        self.assertEqual(list(samples['avg_cov']), [39.5, 40.5])
+        self.assertEqual(list(samples['avg_path_eff']), [84.5, 86.5])
+        self.assertTrue(os.path.exists(self.filename)) # Converted once, so later runs read the .npz
+        self.assertEqual(list(load_threshold_samples(self.filename)['avg_collisions']), [47.0, 0.5])
+
+    def test_legacy_json_file_is_preferred_over_text(self):
+        with open(os.path.join(self.tmp.name, "normal_user_thresholds.txt"), 'w') as f:
+            f.write("avg_cov:1.0\n")
+        with open(os.path.join(self.tmp.name, "normal_user_thresholds.json"), 'w') as f:
+            f.write('{"avg_cov": [2.0, 3.0], "avg_collisions": [], "avg_path_eff": [4.0]}')
+        samples = load_threshold_samples(self.filename)
+        self.assertEqual(list(samples['avg_cov']), [2.0, 3.0])
+        self.assertEqual(list(samples['avg_path_eff']), [4.0])
+
+    def test_malformed_legacy_file_gives_empty_samples(self):
+        with open(os.path.join(self.tmp.name, "normal_user_thresholds.txt"), 'w') as f:
+            f.write("avg_cov:not-a-number\n")
+        self.assertEmptySamples(load_threshold_samples(self.filename))
+        self.assertFalse(os.path.exists(self.filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# thresholds.py
+# Normal-user benchmark samples: the per-session averages that rehab patients' reports are compared against
+import os
+import json
+import zipfile
+from collections import deque
+import numpy as np
+
+THRESHOLD_METRICS = ('avg_cov', 'avg_collisions', 'avg_path_eff')
+THRESHOLDS_HISTORY = 200 # Most recent sessions kept per metric, so the benchmark and the file stop growing
+# Earlier releases kept the samples next to the .npz as 'key:v1,v2,...' text lines, then as JSON lists
+LEGACY_THRESHOLDS_EXTENSIONS = ('.json', '.txt') # Newest format first
+
+def save_threshold_samples(filename, samples):
+    """
+    Writes each metric's samples as one binary float64 array, so no float is ever formatted or parsed as text.
+    It goes to a temporary file first and replaces the old one only once fully on disk, so a crash mid-save
+    never leaves a truncated thresholds file behind. Raises OSError if the file can't be written.
+    """
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, 'wb', buffering=1 << 20) as f:
+        np.savez(f, **{metric: np.asarray(values, dtype=np.float64) for metric, values in samples.items()})
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+
+def _read_legacy_samples(filename):
+    """A legacy thresholds file's samples as {metric: [floats]}."""
+    with open(filename, 'r') as f:
+        if filename.endswith('.json'):
+            return {metric: [float(v) for v in values] for metric, values in json.load(f).items()}
+        samples = {}
+        for line in f:
+            if ':' not in line: continue
+            metric, values = line.strip().split(':', 1)
+            samples[metric] = [float(v) for v in values.split(',') if v]
+        return samples
+
+def _import_legacy_samples(filename):
+    """
+    One-time conversion for deployments that predate the .npz file: reads the newest legacy file found beside
+    it and saves it as filename, so later runs load the .npz. The legacy file is left in place.
+    """
+    base = os.path.splitext(filename)[0]
+    for legacy in (base + ext for ext in LEGACY_THRESHOLDS_EXTENSIONS):
+        if not os.path.exists(legacy): continue
+        try:
+            samples = _read_legacy_samples(legacy)
+        except (OSError, ValueError, AttributeError) as e: # Unreadable, malformed, or JSON of the wrong shape
+            print(f"Error reading legacy thresholds file {legacy}: {e}")
+            continue
+        print(f"Importing normal-user benchmarks from {legacy}")
+        try:
+            save_threshold_samples(filename, samples)
+        except OSError as e:
+            print(f"Error saving thresholds: {e}") # Still usable for this run; the import is retried next time
+        return samples
+    return None
+
+def load_threshold_samples(filename):
+    """
+    Each metric's saved session samples as a bounded deque (appending beyond THRESHOLDS_HISTORY drops the oldest).
+    A missing or unreadable file gives empty deques, so a damaged file never stops a report being written.
+    """
+    samples = {metric: deque(maxlen=THRESHOLDS_HISTORY) for metric in THRESHOLD_METRICS}
+    if os.path.exists(filename):
+        try:
+            with open(filename, 'rb') as f, np.load(f) as saved: # Our own handle, closed even when np.load fails
+                samples.update({metric: deque(saved[metric].tolist(), maxlen=THRESHOLDS_HISTORY) for metric in saved.files})
+        # Unreadable, empty (EOFError, e.g. after a crash or a full disk), not an .npz, or a damaged archive
+        except (OSError, EOFError, ValueError, zipfile.BadZipFile) as e:
+            print(f"Error reading thresholds file: {e}")
+    else:
+        legacy = _import_legacy_samples(filename)
+        if legacy:
+            samples.update({metric: deque(values, maxlen=THRESHOLDS_HISTORY) for metric, values in legacy.items()})
+    return samples